@@ -316,19 +316,19 @@ class InterRegionInputOutput(InterRegionInputOutputBaseClass):
                 f"Raw region type {type(self._raw_region_data)} not implemented, use a GeoDataFrame."
             )
 
-    @property
+    @cached_property
     def _ij_index(self) -> MultiIndex:
         """Return self.region x self.region MultiIndex."""
         return generate_ij_index(self.regions, self.regions)
 
-    @property
+    @cached_property
     def _ij_m_index(self) -> MultiIndex:
         """Return self.region x self.region MultiIndex."""
         return generate_ij_m_index(
             self.regions, self.sectors, self.national_column_name
         )
 
-    @property
+    @cached_property
     def _i_m_index(self) -> MultiIndex:
         """Return self.region_names x self.sector_names MultiIndex."""
         return generate_i_m_index(
@@ -354,7 +354,7 @@ class InterRegionInputOutput(InterRegionInputOutputBaseClass):
                     f"At least `self.date` or `self.employment_date` required"
                 )
 
-    @property
+    @cached_property
     def technical_coefficients(self) -> DataFrame:
         """Return the technical coefficients derived from `self.io_table`.
 
@@ -512,7 +512,7 @@ class InterRegionInputOutput(InterRegionInputOutputBaseClass):
             sum_if_multi_column_df(self.E_i_m_full).unstack(), self.sector_names
         )
 
-    @property
+    @cached_property
     def distances(self) -> GeoDataFrame:
         """Return a GeoDataFrame of all distances between regions.
 
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import shutil
+from copy import copy
 from dataclasses import KW_ONLY, Field, dataclass, field, fields
 from datetime import date, datetime
 from io import BytesIO
@@ -19,6 +20,7 @@ from typing import (
     Final,
     Optional,
     Protocol,
+    Self,
     Type,
     TypeAlias,
     Union,
@@ -32,6 +34,7 @@ from zipfile import ZipFile
 from pandas import DataFrame, Series, read_csv, read_excel
 
 from .utils import (
+    field_names,
     filter_fields_by_type,
     filter_fields_by_types,
     get_attr_from_str,
@@ -47,6 +50,12 @@ FileOrURLType: TypeAlias = FilePathType | Request
 
 
 UK_DATA_PATH: Final[Path] = Path("uk/data")
+META_DATA_KWARGS_ATTRS: Final[tuple[str, ...]] = (
+    "_api_kwargs",
+    "_save_kwargs",
+    "_reader_kwargs",
+    "_post_read_kwargs",
+)
 DOI_URL_PREFIX: Final[str] = "https://doi.org/"
 
 CURL_USER_AGENT: Final[str] = "curl/7.79.1"
@@ -454,6 +463,53 @@ class MetaData:
         """Change path to passed folder_path while keeping self.path stem."""
         self.path = Path(str(folder_path)) / Path(str(self.path)).name
 
+    def clone(
+        self,
+        reader_kwargs: dict[str, Any] | None = None,
+        folder: PathLike | None = None,
+        **kwargs,
+    ) -> Self:
+        """Return a shallow copy with its own `kwargs` `dicts` and overrides.
+
+        This avoids `deepcopy` traversing readers and other nested objects
+        and, unlike `dataclasses.replace`, does not rerun `__post_init__`
+        (which may trigger a download).
+
+        Args:
+            reader_kwargs: updates to the copied `_reader_kwargs`.
+            folder: folder to move the copy's `path` to via `set_folder`.
+            **kwargs: attributes to set on the copy.
+
+        Returns:
+            A copy of `self` with `reader_kwargs`, `folder` and `kwargs` applied.
+
+        Raises:
+            AttributeError: If a `kwargs` key is not a field of `self`.
+
+        Example:
+            ```pycon
+            >>> meta_data = MetaData(name="Example", year=2017, region="UK")
+            >>> cloned = meta_data.clone(path="a.csv", reader_kwargs={"x": 1})
+            >>> cloned.path, cloned._reader_kwargs, meta_data._reader_kwargs
+            ('a.csv', {'x': 1}, {})
+
+            ```
+        """
+        meta_data_field_names: tuple[str, ...] = field_names(fields(self))
+        for attr_name in kwargs:
+            if attr_name not in meta_data_field_names:
+                raise AttributeError(f"{attr_name} is not a field of {self}")
+        cloned: Self = copy(self)
+        for kwargs_attr in META_DATA_KWARGS_ATTRS:
+            setattr(cloned, kwargs_attr, dict(getattr(self, kwargs_attr)))
+        if reader_kwargs:
+            cloned._reader_kwargs.update(reader_kwargs)
+        for attr_name, value in kwargs.items():
+            setattr(cloned, attr_name, value)
+        if folder:
+            cloned.set_folder(folder)
+        return cloned
+
     @property
     def has_read_func(self) -> bool:
         return callable(self._reader_func)
@@ -558,6 +614,9 @@ class MetaData:
     ) -> SupportedAttrDataTypes | None:
         """Get file from self.url and save locally.
 
+        If already saved locally (including package data shipped with
+        `estios`) nothing is downloaded unless `force_overwrite` is `True`.
+
         Todo:
             * May need to refactor means of creating local folder below vs _save_func.
         """
@@ -588,6 +647,7 @@ class MetaData:
                     raise NoDataReturnedError(
                         f"With `force_overwrite` False and `is_local` True, cannot return already saved {self}"
                     )
+                return None
             else:
                 logger.debug(
                     f"{self.path} already exists. Overwriting as 'force_overwrite' set to True"
@@ -1,7 +1,6 @@
-from copy import deepcopy
 from logging import getLogger
 from pathlib import Path
-from typing import Callable, Sequence
+from typing import Any, Callable, Sequence
 
 from pandas import DataFrame, Series
 
@@ -228,6 +227,7 @@ def meta_data_reader_wrapper(
     local_path: FilePathType,
     data_filter_func: Callable,
     df_kwarg: str = "nomis_employment_df",
+    read_kwargs: dict[str, Any] | None = None,
     **kwargs,
 ) -> DataFrame | Series:
     """Wrapper to return data from `path`, and potentially download if necessary.
@@ -237,11 +237,12 @@ def meta_data_reader_wrapper(
         local_path: `Path` file is saved to.
         data_filter_func: `Callable` to convert data to `DataFrame` or `Series`.
         df_kwargs: Arguments to pass to `data_filter_func`.
+        read_kwargs: Arguments to pass to the file reader (eg `usecols`, `dtype`).
 
     Returns:
         A `DataFrame` or `Series` from processing `path` via copy at `local_path`.
     """
-    loaded_df = pandas_from_path_or_package(path, local_path)
+    loaded_df = pandas_from_path_or_package(path, local_path, **(read_kwargs or {}))
     kwargs[df_kwarg] = loaded_df
     return data_filter_func(**kwargs)
 
@@ -328,7 +329,7 @@ def regional_population_projections_working_ages(year: str | int, **kwargs) -> S
     )
 
 
-NOMIS_NATIONAL_EMPLOYMENT_2017_METADATA = deepcopy(NOMIS_METADATA)
+NOMIS_NATIONAL_EMPLOYMENT_2017_METADATA = NOMIS_METADATA.clone()
 NOMIS_NATIONAL_EMPLOYMENT_2017_METADATA.name = "NOMIS UK Annual National Employment"
 NOMIS_NATIONAL_EMPLOYMENT_2017_METADATA.year = 2017
 NOMIS_NATIONAL_EMPLOYMENT_2017_METADATA.auto_download = True
@@ -348,14 +349,14 @@ NOMIS_NATIONAL_EMPLOYMENT_2017_METADATA.path = "nomis_national_employment.csv"
 
 # NOMIS_NATIONAL_EMPLOYMENT_2017_METADATA._package_data = True
 
-NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA = deepcopy(NOMIS_METADATA)
+NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA = NOMIS_METADATA.clone()
 NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA.name = "NOMIS UK Annual Regional Employment"
 NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA.year = 2017
 NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA.auto_download = True
 NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA._package_data = True
 NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA._package_path = Path("uk/data")
 NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA._api_func = clean_nomis_employment_query
-NOMIS_NATIONAL_EMPLOYMENT_2017_METADATA._api_kwargs = dict(year=2017)
+NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA._api_kwargs = dict(year=2017)
 NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA._reader_func = meta_data_reader_wrapper
 NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA._reader_kwargs = dict(
     data_filter_func=get_employment_by_region_by_sector,
@@ -369,7 +370,7 @@ NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA._post_read_kwargs = dict(
 NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA.path = "nomis_regional_employment.csv"
 
 
-ONS_MID_YEAR_POPULATIONS_2017_METADATA = deepcopy(ONS_CONTEMPORARY_POPULATION_META_DATA)
+ONS_MID_YEAR_POPULATIONS_2017_METADATA = ONS_CONTEMPORARY_POPULATION_META_DATA.clone()
 ONS_MID_YEAR_POPULATIONS_2017_METADATA.name = (
     "UK ONS 2017 Mid-Year Population Estimates"
 )
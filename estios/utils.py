@@ -25,7 +25,8 @@ from typing import (
 )
 
 # from networkx import DiGraph
-from numpy import log
+from numpy import errstate, float64, log, nan, ndarray, where
+from numpy.typing import ArrayLike
 from pandas import DataFrame, Index, MultiIndex, Series, read_csv
 
 # from .uk.employment import CITY_SECTOR_REGION_PREFIX
@@ -231,6 +232,24 @@ def log_x_or_return_zero(x: float) -> Optional[float]:
     return log(x) if log(x) > 0 else 0.0
 
 
+def log_x_or_return_zero_array(x: ArrayLike) -> ndarray:
+    """Return a vectorised `log_x_or_return_zero`, with `nan` where `x` < 0.
+
+    Args:
+        x: array of numbers to take `log` of if >= 0.
+
+    Returns:
+        `ndarray` of $log(x)$ if $log(x)> 0$ else $0.0$, or `nan` if $x < 0$.
+    """
+    x_array: ndarray = Series(x, dtype=float64).to_numpy()
+    negatives: ndarray = x_array < 0
+    if negatives.any():
+        logger.error(f"Cannot log {x_array[negatives]} < 0")
+    with errstate(divide="ignore", invalid="ignore"):
+        logged: ndarray = log(x_array)
+    return where(negatives, nan, where(logged > 0, logged, 0.0))
+
+
 def enforce_start_str(string: str, prefix: str, on: bool) -> str:
     """Ensure a string's prefix characters of a string are there or removed."""
     if on:
@@ -1,35 +1,48 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from __future__ import annotations
+
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import cycle
 from logging import getLogger
-from typing import Callable, Final, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Callable, Final, Iterable, Optional, Union
+from weakref import ref
 
 from dotenv import load_dotenv
-from geopandas import GeoDataFrame
+from geopandas import GeoDataFrame, GeoSeries
 from pandas import DataFrame, MultiIndex, Series
 from plotly.colors import qualitative
-from plotly.express import bar, line, scatter_mapbox, set_mapbox_access_token
-from plotly.graph_objects import Figure, Scattermapbox
+
+if TYPE_CHECKING:
+    from plotly.graph_objects import Figure
 
 from .calc import LATEX_e_i_m, LATEX_m_i_m, LATEX_y_ij_m
 from .uk.regions import CENTRE_FOR_CITIES_EPSG, CENTRE_FOR_CITIES_REGION_COLUMN
-from .utils import OTHER_CITY_COLUMN, filter_y_ij_m_by_city_sector, log_x_or_return_zero
+from .utils import (
+    OTHER_CITY_COLUMN,
+    filter_y_ij_m_by_city_sector,
+    log_x_or_return_zero,
+    log_x_or_return_zero_array,
+)
 
 logger = getLogger(__name__)
 
-load_dotenv()
-try:
-    set_mapbox_access_token(os.environ["MAPBOX"])
-except KeyError:
-    logger.warning("MAPBOX access token not found in local .env file.")
-
 # These can be uncommented to use Mapbox's native vector format via a key in a local .env file
 # MAPBOX_STYLE: Final[str] = "dark"
 MAPBOX_DARKMODE_MAP_CONFIG: Final[str] = "carto-darkmatter"
 MAPBOX_STYLE: Final[str] = MAPBOX_DARKMODE_MAP_CONFIG
+MAPBOX_TOKEN_FREE_STYLES: Final[tuple[str, ...]] = (
+    "white-bg",
+    "open-street-map",
+    "carto-positron",
+    MAPBOX_DARKMODE_MAP_CONFIG,
+    "stamen-terrain",
+    "stamen-toner",
+    "stamen-watercolor",
+)
 JOBS_COLUMN: Final[str] = "Total Jobs 2017"
 ZOOM_DEFAULT: Final[float] = 4.7
 
@@ -44,6 +57,88 @@ DEFAULT_FONT_COLOUR: Final[str] = "white"
 DEFAULT_FONT_FACE: Final[str] = "Georgia"
 DEFAULT_FONT_SIZE: Final[int] = 12
 
+FILTERED_FLOWS_CACHE_SIZE: Final[int] = 128
+
+
+@lru_cache(None)
+def _init_mapbox() -> None:
+    """Set the `MAPBOX` access token from a local `.env` file once.
+
+    Only needed for `mapbox` vector styles (not `MAPBOX_TOKEN_FREE_STYLES`),
+    so this is called when first drawing a map in such a style.
+
+    Note:
+        `plotly.express` is imported here rather than at module level as
+        it is slow to import and is not needed for non-`mapbox` plots.
+    """
+    from plotly.express import set_mapbox_access_token
+
+    load_dotenv()
+    mapbox_token: str | None = os.environ.get("MAPBOX")
+    if mapbox_token:
+        set_mapbox_access_token(mapbox_token)
+    else:
+        logger.warning("MAPBOX access token not found in local .env file.")
+
+
+class _ResultsKey:
+
+    """Hashable identity key for an unhashable `DataFrame` of results.
+
+    Only a `weakref` to the `DataFrame` is kept, so cache entries neither
+    keep results alive nor match a new `DataFrame` reusing the same `id`.
+
+    Note:
+        Keys compare by identity, not content, so a `DataFrame` modified
+        in place still matches its earlier cache entries.
+    """
+
+    def __init__(self, results: DataFrame) -> None:
+        self._id: int = id(results)
+        self._ref: ref[DataFrame] = ref(results)
+
+    def __hash__(self) -> int:
+        return self._id
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, _ResultsKey)
+            and self._id == other._id
+            and self._ref() is other._ref()
+        )
+
+
+@lru_cache(maxsize=FILTERED_FLOWS_CACHE_SIZE)
+def _filter_y_ij_m_cached(key: _ResultsKey, city: str, sector: str) -> Series:
+    """Cache `filter_y_ij_m_by_city_sector` results per `key` `DataFrame`."""
+    y_ij_m_results: DataFrame | None = key._ref()
+    assert y_ij_m_results is not None
+    return filter_y_ij_m_by_city_sector(y_ij_m_results, city, sector)
+
+
+def filter_flows_cached(
+    y_ij_m_results: DataFrame, selected_city: str, selected_sector: str
+) -> Series:
+    """Return a copy of cached `filter_y_ij_m_by_city_sector` results.
+
+    Args:
+        y_ij_m_results: `DataFrame` of Input-Output convergance results.
+        selected_city: city name.
+        selected_sector: sector name.
+
+    Returns:
+        `Series` of queried `selected_city` and `selected_sector`, copied
+        so callers can modify it without altering the cache.
+
+    Note:
+        Results are cached by `y_ij_m_results` identity, so it must not be
+        modified in place after it is first passed here. Pass a modified
+        copy instead, or call `_filter_y_ij_m_cached.cache_clear()`.
+    """
+    return _filter_y_ij_m_cached(
+        _ResultsKey(y_ij_m_results), selected_city, selected_sector
+    ).copy()
+
 
 @dataclass
 class FontConfig:
@@ -117,6 +212,10 @@ def mapbox_cities_fig(
         Configured instances of `scatter_mapbox`, including with city
         coordinates converted via `convert_geom_for_mapbox`.
     """
+    from plotly.express import scatter_mapbox
+
+    if mapbox_style not in MAPBOX_TOKEN_FREE_STYLES:
+        _init_mapbox()
     mapbox_cities = convert_geom_for_mapbox(cities)
     return scatter_mapbox(
         mapbox_cities,
@@ -148,10 +247,15 @@ def convert_geom_for_mapbox(
         `GeoDataFrame` with `geometry` converted for `mapbox`.
     """
     if type(geo_df) is Series:
-        geo_df = GeoDataFrame(DataFrame(geo_df).T, crs=series_crs)
+        geo_df = GeoDataFrame(
+            {column: [value] for column, value in geo_df.items()},
+            index=[geo_df.name],
+            crs=series_crs,
+        )
     mapbox_geo_df: GeoDataFrame = geo_df.copy()
-    mapbox_geo_df["lon"] = mapbox_geo_df.to_crs(epsg=epsg_code).geometry.x
-    mapbox_geo_df["lat"] = mapbox_geo_df.to_crs(epsg=epsg_code).geometry.y
+    mapbox_points: GeoSeries = mapbox_geo_df.geometry.to_crs(epsg=epsg_code)
+    mapbox_geo_df["lon"] = mapbox_points.x.to_numpy()
+    mapbox_geo_df["lat"] = mapbox_points.y.to_numpy()
     return mapbox_geo_df
 
 
@@ -195,6 +299,8 @@ def add_mapbox_edges(
     Returns:
         `Plotly` `Figure` with `mabpox` lines rendered.
     """
+    from plotly.graph_objects import Figure, Scattermapbox
+
     if fig is None:
         fig = Figure()
     # if reverse_render_order:
@@ -203,6 +309,17 @@ def add_mapbox_edges(
     mapbox_destinations: GeoDataFrame = convert_geom_for_mapbox(cities)
     logger.warning("Check add_mapbox_edges weight indexing by values")
     mapbox_destinations["weight"] = weight.values if weight is not None else 1.0
+    line_widths: Series
+    if plot_line_scaling_func is log_x_or_return_zero:
+        line_widths = Series(
+            log_x_or_return_zero_array(mapbox_destinations["weight"]),
+            index=mapbox_destinations.index,
+        )
+    else:
+        line_widths = mapbox_destinations["weight"].map(plot_line_scaling_func)
+    mapbox_destinations["line_width"] = line_widths.astype(object).where(
+        line_widths.notna(), None
+    )
     # else:
     # mapbox_destinations['weight'] = [2*x + 1 for x in range(len(mapbox_destinations.index))]
     mapbox_destinations.apply(
@@ -213,7 +330,7 @@ def add_mapbox_edges(
                 # mode="lines+text",
                 mode="lines",
                 line={
-                    "width": plot_line_scaling_func(dest_city_row["weight"]),
+                    "width": dest_city_row["line_width"],
                     "color": colour_palette[dest_city_row.name]
                     if colour_palette
                     else None,
@@ -284,9 +401,7 @@ def draw_ego_flows_network(
     if fig is None:
         fig = mapbox_cities_fig(region_data, zoom=zoom, colour_column=colour_column)
     selected_city_data: Series = region_data.loc[selected_city]
-    flows: Series = filter_y_ij_m_by_city_sector(
-        y_ij_m_results, selected_city, selected_sector
-    )
+    flows: Series = filter_flows_cached(y_ij_m_results, selected_city, selected_sector)
     if n_flows:
         if isinstance(n_flows, int):
             # This will probably be deprecated
@@ -335,9 +450,9 @@ def sector_flows_bar_chart(
         * Factor out the filter call.
         * Better solution for setting colour_column index
     """
-    flows: Series = filter_y_ij_m_by_city_sector(
-        y_ij_m_results, selected_city, selected_sector
-    )
+    from plotly.express import bar
+
+    flows: Series = filter_flows_cached(y_ij_m_results, selected_city, selected_sector)
     if isinstance(flows.index, MultiIndex):
         flows.index = flows.index.get_level_values(other_city_column_name)
     if sort_regions:
@@ -410,6 +525,8 @@ def time_series_line(
         A `plotly` `Figure` with a `plotly.line`, primarily designed for a
         time series.
     """
+    from plotly.express import line
+
     if transpose:
         time_series = time_series.T
     return line(time_series, labels=labels, **kwargs)
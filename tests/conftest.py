@@ -1,66 +1,199 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import json
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
+from dataclasses import replace
+from datetime import date
+from hashlib import sha256
 from logging import getLogger
+from os import PathLike, environ
+from pathlib import Path
+from pickle import PicklingError
+from shutil import rmtree
 from string import ascii_uppercase
-from typing import Any, Callable, Generator, Sequence
+from types import MappingProxyType, ModuleType, SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Final, Sequence
 
 import pytest
 from filelock import FileLock
-from geopandas import GeoDataFrame
-from pandas import DataFrame, Series
+from numpy import array, ndarray
+from pandas import DataFrame, Index, Series, read_pickle, to_pickle
 
-from estios.models import InterRegionInputOutput, InterRegionInputOutputTimeSeries
+from estios import __version__
 from estios.sources import MetaData, MonthDay
-from estios.spatial import GenericRegionsManager
-from estios.uk.input_output_tables import InputOutputTableUK2017
-from estios.uk.models import InterRegionInputOutputUK2017
-from estios.uk.nomis_contemporary_employment import (
-    NOMIS_API_KEY,
-    NOMIS_LETTER_SECTOR_QUERY_PARAM_DICT,
-    NOMIS_SECTOR_EMPLOYMENT_TABLE_CODE,
-    APIKeyNomisError,
-    clean_nomis_employment_query,
-    national_employment_query,
-    nomis_query,
-)
-from estios.uk.ons_employment_2017 import generate_employment_quarterly_dates
-from estios.uk.ons_population_projections import (
-    ONS_ENGLAND_POPULATION_META_DATA,
-    ONS_PROJECTION_YEARS,
-    ONSPopulationProjection,
-)
-from estios.uk.ons_uk_population_history import ONS_UK_POPULATION_HISTORY_META_DATA
-from estios.uk.populations import (
-    NOMIS_NATIONAL_EMPLOYMENT_2017_METADATA,
-    NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA,
-)
-from estios.uk.regions import (
-    TEN_UK_CITY_REGIONS,
-    get_all_centre_for_cities_dict,
-    load_and_join_centre_for_cities_data,
-)
-from estios.uk.scenarios import annual_io_time_series_ons_2017
-from estios.uk.utils import (
-    THREE_UK_CITY_REGIONS,
-    PUASManager,
-    generate_uk_puas,
-    get_working_cities_puas_manager,
-    load_contemporary_ons_population,
-)
-from estios.utils import SECTOR_10_CODE_DICT
+from estios.utils import SECTOR_10_CODE_DICT, generate_i_m_index
+
+if TYPE_CHECKING:
+    from geopandas import GeoDataFrame
+
+    from estios.models import InterRegionInputOutput, InterRegionInputOutputTimeSeries
+    from estios.uk.input_output_tables import InputOutputTableUK2017
+    from estios.uk.models import InterRegionInputOutputUK2017
+    from estios.uk.ons_population_projections import ONSPopulationProjection
+    from estios.uk.utils import PUASManager
 
 logger = getLogger(__name__)
 
+ESTIOS_PYTEST_CACHE_FOLDER: Final[str] = "estios-data"
+# Increment to invalidate all results `cached_pickle` saved in the `pytest` cache
+ESTIOS_PYTEST_CACHE_VERSION: Final[int] = 1
+NOMIS_PYTEST_CACHE_FOLDER: Final[str] = "nomis-2017"
+# Default `InterRegionInputOutputUK2017` sectors, for reference fixtures
+_SECTOR_10_INDEX: Final[Index] = Index([*SECTOR_10_CODE_DICT])
+# Equal to `estios.uk.input_output_tables.UK_EXPORT_COLUMN_NAMES`, which is
+# not imported as importing `estios.uk` reads (and may download) ONS data
+_UK_EXPORT_COLUMN_NAMES: Final[list[str]] = [
+    "Exports to EU",
+    "Exports outside EU",
+    "Exports of services",
+]
+NOMIS_API_FIXTURES: Final[tuple[str, ...]] = (
+    "_nomis_2017_queries",
+    "nomis_2017_regional_employment_raw",
+    "nomis_2017_regional_employment_filtered",
+    "nomis_2017_10_cities_employment",
+    "nomis_2017_3_cities_employment",
+    "nomis_2017_national_employment",
+    "nomis_2017_nation_employment_table",
+)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add a `--refresh-nomis` option to rerun cached `NOMIS` queries."""
+    parser.addoption(
+        "--refresh-nomis",
+        action="store_true",
+        default=False,
+        help="Query NOMIS again rather than reuse results from previous sessions.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Clear cached `NOMIS` results if `--refresh-nomis` is passed.
+
+    Only run outside `xdist` workers, so results are cleared once before
+    any worker starts querying.
+    """
+    cache: pytest.Cache | None = getattr(config, "cache", None)
+    if (
+        cache
+        and config.getoption("refresh_nomis")
+        and not environ.get("PYTEST_XDIST_WORKER")
+    ):
+        rmtree(
+            cache.mkdir(ESTIOS_PYTEST_CACHE_FOLDER) / NOMIS_PYTEST_CACHE_FOLDER,
+            ignore_errors=True,
+        )
+
+
+def sort_items_by_fixtures(items: list[pytest.Item]) -> None:
+    """Sort `items` within each module and class by the fixtures they use.
+
+    Tests sharing fixtures run together, so `function` scoped fixtures
+    are set up in runs and tests needing expensive `session` fixtures are
+    grouped. Module and class order is kept so their scoped fixtures are
+    not torn down and rebuilt. The sort is stable, so tests with the same
+    fixtures keep their written order.
+
+    Args:
+        items:
+            collected `pytest` items, sorted in place
+    """
+
+    def item_group(item: pytest.Item) -> tuple[str, str | None]:
+        cls: type | None = getattr(item, "cls", None)
+        return str(item.path), cls.__name__ if cls else None
+
+    group_order: dict[tuple[str, str | None], int] = {}
+    for item in items:
+        group_order.setdefault(item_group(item), len(group_order))
+    items.sort(
+        key=lambda item: (
+            group_order[item_group(item)],
+            tuple(sorted(getattr(item, "fixturenames", ()))),
+        )
+    )
+
+
+def mark_items_by_fixture_marks(
+    items: list[pytest.Item],
+    fixture_names: Sequence[str] = NOMIS_API_FIXTURES,
+    mark_name: str = "remote_data",
+) -> None:
+    """Add `mark_name` marks on `fixture_names` fixtures to `items` using them.
+
+    Marks on fixture functions are not applied to tests, so plugins like
+    `pytest-remotedata` would otherwise set up those fixtures for tests
+    which are not marked themselves. By default only the `NOMIS` query
+    fixtures are checked, which always need network access. Fixtures like
+    `three_cities_results` are not, so tests using them still run by
+    default.
+
+    Args:
+        items:
+            collected `pytest` items, marked in place
+        fixture_names:
+            names of fixtures defined in this module to check for marks
+        mark_name:
+            name of fixture marks to add to `items`
+    """
+    fixture_marks: dict[str, pytest.MarkDecorator] = {
+        name: getattr(pytest.mark, mark_name).with_args(*mark.args, **mark.kwargs)
+        for name in fixture_names
+        for mark in getattr(globals().get(name), "pytestmark", [])
+        if mark.name == mark_name
+    }
+    for item in items:
+        if item.get_closest_marker(mark_name):
+            continue
+        for fixture_name in getattr(item, "fixturenames", ()):
+            if fixture_name in fixture_marks:
+                item.add_marker(fixture_marks[fixture_name])
+                break
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Group tests by fixtures and skip `NOMIS` queries without a key.
+
+    Tests are sorted via `sort_items_by_fixtures`. Tests using any
+    `NOMIS_API_FIXTURES` are marked `remote_data` via
+    `mark_items_by_fixture_marks`. Tests marked `nomis` or using any
+    `NOMIS_API_FIXTURES` are skipped at collection if `NOMIS_API_KEY` is
+    not set, avoiding their fixture setup when they cannot run. The `NOMIS`
+    module (and `ukcensusapi`) is only imported if such tests are collected.
+    """
+    sort_items_by_fixtures(items)
+    mark_items_by_fixture_marks(items)
+    nomis_items: list[pytest.Item] = [
+        item
+        for item in items
+        if "nomis" in item.keywords
+        or set(NOMIS_API_FIXTURES).intersection(getattr(item, "fixturenames", ()))
+    ]
+    if not nomis_items:
+        return
+    from estios.uk.nomis_contemporary_employment import NOMIS_API_KEY
+
+    if NOMIS_API_KEY:
+        return
+    skip_nomis = pytest.mark.skip(
+        reason="To run these tests a `NOMIS_API_KEY` is required in `.env`"
+    )
+    for item in nomis_items:
+        item.add_marker(skip_nomis)
+
 
 def xdist_session_data_wrapper(
     tmp_path_factory: pytest.TempPathFactory,
     worker_id: str,
-    func: Callable[..., Generator | Any],
-    is_generator: bool = True,
+    func: Callable[..., Any],
     include_fixture_path: bool = True,
+    file_name: str | None = None,
     *args,
     **kwargs,
 ) -> Any:
@@ -69,6 +202,14 @@ def xdist_session_data_wrapper(
     This is derived from the instruction:
     https://pytest-xdist.readthedocs.io/en/latest/how-to.html#making-session-scoped-fixtures-execute-only-once
 
+    Data is pickled to share across workers, so `func` may return any
+    picklable object, including models. Once saved, workers read
+    `file_name` without waiting on the lock. It is written to a temporary
+    file and moved into place with `Path.replace`, so is never read
+    partially written. If `func` results cannot be pickled each worker
+    calls `func` itself. Each `file_name` has its own lock, so fixtures
+    using this wrapper do not wait on each other.
+
     Args:
         tmp_path_factory:
             `pytest` temporary path provided from caller needed for
@@ -76,53 +217,229 @@ def xdist_session_data_wrapper(
         worker_id:
             a `str` to distinguish which worker called `func`
         func:
-            a `Generator` that `yield` the fixture
-        is_generator:
-            whether the `func` is a `Generator` or a normal function
+            a function returning the fixture data
         include_fixture_path:
             whether to pass the `tmp_path_factory` to `func`
-
-    Yields:
-        A `Generator` of fixture data
+        file_name:
+            name of the file shared by all workers to save results to,
+            by default a hash of `func` and the `args` and `kwargs` passed
+            to it, which should have the same `repr` in every worker
 
     Returns:
         A fixture data object
     """
+    if not file_name:
+        func_key: str = f"{func.__module__}.{func.__qualname__}-{args!r}-{kwargs!r}"
+        file_name = f"{sha256(func_key.encode()).hexdigest()[:16]}.pkl"
     if include_fixture_path:
         kwargs["tmp_path_factory"] = tmp_path_factory
     if worker_id == "master":
-        yield from func(*args, **kwargs)
+        return func(*args, **kwargs)
 
     # get the temp directory shared by all workers
-    root_tmp_dir = tmp_path_factory.getbasetemp().parent
-
-    fn = root_tmp_dir / "data.json"
-    with FileLock(str(fn) + ".lock"):
-        if fn.is_file():
-            data = json.loads(fn.read_text())
+    data_path: Path = tmp_path_factory.getbasetemp().parent / file_name
+    if data_path.is_file():
+        return read_pickle(data_path)
+    with FileLock(f"{data_path}.lock"):
+        if data_path.is_file():
+            return read_pickle(data_path)
+        data: Any = func(*args, **kwargs)
+        partial_path: Path = data_path.with_name(f"{data_path.name}.partial")
+        try:
+            to_pickle(data, partial_path)
+        except (PicklingError, TypeError, AttributeError) as err:
+            logger.warning(f"Cannot share {file_name} across workers: {err}")
+            partial_path.unlink(missing_ok=True)
         else:
-            data = (
-                yield from func(*args, **kwargs)
-                if is_generator
-                else func(*args, **kwargs)
-            )
-            fn.write_text(json.dumps(data))
-    if is_generator:
-        yield data
-    else:
+            partial_path.replace(data_path)
+    return data
+
+
+def cached_pickle(
+    cache: pytest.Cache,
+    key: str,
+    build_func: Callable[[], Any],
+    cache_folder_name: str = ESTIOS_PYTEST_CACHE_FOLDER,
+) -> Any:
+    """Return `build_func` results, pickled in the `pytest` cache by `key`.
+
+    Results are kept between `pytest` sessions, skipping repeat downloads
+    and parsing. Keys include `__version__` and `ESTIOS_PYTEST_CACHE_VERSION`.
+    Run `pytest --cache-clear` to refresh them. A `FileLock`
+    ensures only one `xdist` worker builds and saves each `key`. Results
+    that cannot be pickled are returned without caching.
+
+    Args:
+        cache:
+            `pytest` `Cache` instance from `pytestconfig.cache`
+        key:
+            a `str` identifying the data to cache, like a source `url`
+        build_func:
+            function to call to generate data if not already cached
+        cache_folder_name:
+            folder name within the `pytest` cache to save results to
+
+    Returns:
+        `build_func` results from either the `pytest` cache or `build_func`
+    """
+    cache_key: str = sha256(
+        f"{__version__}-{ESTIOS_PYTEST_CACHE_VERSION}-{key}".encode()
+    ).hexdigest()
+    cache_path: Path = cache.mkdir(cache_folder_name) / f"{cache_key}.pkl"
+    with FileLock(f"{cache_path}.lock"):
+        if cache_path.is_file():
+            try:
+                return read_pickle(cache_path)
+            except Exception as err:
+                logger.warning(f"Failed to load {cache_path}, regenerating: {err}")
+        data: Any = build_func()
+        try:
+            to_pickle(data, cache_path)
+        except (PicklingError, TypeError, AttributeError) as err:
+            logger.warning(f"Cannot cache {key} in {cache_path}: {err}")
+            cache_path.unlink(missing_ok=True)
         return data
 
 
-@pytest.fixture
+def _sources_key(*sources: ModuleType | PathLike | str | None) -> str:
+    """Return a `cached_pickle` key part which changes when `sources` do.
+
+    Modules are keyed by their source file. Each file's name, size and
+    modification time are included, so editing input data or code rebuilds
+    cached results. Files which do not exist are skipped.
+
+    Args:
+        sources:
+            modules and data file paths results are built from
+
+    Returns:
+        A `str` of each source file's name, size and modification time
+    """
+    source_stats: list[str] = []
+    for source in sources:
+        if isinstance(source, ModuleType):
+            source = source.__file__
+        if not source or not Path(source).is_file():
+            continue
+        stat = Path(source).stat()
+        source_stats.append(f"{Path(source).name}:{stat.st_size}:{stat.st_mtime_ns}")
+    return "-".join(source_stats)
+
+
+def cached_pandas_read(
+    cache: pytest.Cache,
+    key: str,
+    read_func: Callable[[], DataFrame],
+    cache_folder_name: str = ESTIOS_PYTEST_CACHE_FOLDER,
+) -> DataFrame:
+    """Return `read_func` results, pickled in the `pytest` cache by `key`.
+
+    Args:
+        cache:
+            `pytest` `Cache` instance from `pytestconfig.cache`
+        key:
+            a `str` identifying the data to cache, like a source `url`
+        read_func:
+            function to call to generate data if not already cached
+        cache_folder_name:
+            folder name within the `pytest` cache to save results to
+
+    Returns:
+        A `DataFrame` from either the `pytest` cache or `read_func`
+    """
+    return cached_pickle(
+        cache, key=key, build_func=read_func, cache_folder_name=cache_folder_name
+    )
+
+
+def _read_only_array(values: Sequence[float], dtype: str = "float64") -> ndarray:
+    """Return `values` as a read-only `ndarray` to share between fixtures.
+
+    `session` scoped reference fixtures wrap these without copying, so any
+    in place change to them raises a `ValueError` rather than altering
+    expected results for later tests.
+    """
+    values_array: ndarray = array(values, dtype=dtype)
+    values_array.flags.writeable = False
+    return values_array
+
+
+def _read_only_frame(df: DataFrame) -> DataFrame:
+    """Return a copy of `df` backed by one read-only `float64` `ndarray`.
+
+    Building a `DataFrame` from `_read_only_array` columns copies them into
+    a new writable block, so this wraps a read-only copy instead, extending
+    the same in place change protection to `DataFrame` references.
+    """
+    values: ndarray = df.to_numpy(dtype="float64", copy=True)
+    values.flags.writeable = False
+    return DataFrame(values, index=df.index, columns=df.columns, copy=False)
+
+
+def _scratch_subdir(scratch_folder: Path, name: str) -> Path:
+    """Return `name` subfolder of `scratch_folder`, created if needed."""
+    subdir: Path = scratch_folder / name
+    subdir.mkdir(exist_ok=True)
+    return subdir
+
+
+def _locked_call(lock_path: Path, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Return `func(*args, **kwargs)` while holding a `FileLock` on `lock_path`.
+
+    Used for downloads to shared folders which are cached by `func` itself,
+    so concurrent `xdist` workers wait for and then reuse the first result.
+    """
+    with FileLock(f"{lock_path}.lock"):
+        return func(*args, **kwargs)
+
+
+@pytest.fixture(scope="session")
+def _session_scratch(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return one temporary folder for all `session` scoped downloads.
+
+    Note:
+        Under `xdist` each worker has its own `basetemp`, so this returns a
+        folder in their shared parent, letting lock guarded downloads be
+        made once rather than once per worker.
+    """
+    if environ.get("PYTEST_XDIST_WORKER"):
+        shared_scratch: Path = tmp_path_factory.getbasetemp().parent / "estios-session"
+        shared_scratch.mkdir(exist_ok=True)
+        return shared_scratch
+    return tmp_path_factory.mktemp("estios-session", numbered=False)
+
+
+@pytest.fixture(scope="session")
+def _nomis_scratch(pytestconfig: pytest.Config) -> Path:
+    """Return a folder in the `pytest` cache for `NOMIS` query results.
+
+    2017 `NOMIS` results do not change, so saved queries are reused between
+    sessions. Run `pytest --refresh-nomis` (or `--cache-clear`) to query
+    `NOMIS` again.
+    """
+    return _scratch_subdir(
+        pytestconfig.cache.mkdir(ESTIOS_PYTEST_CACHE_FOLDER),
+        NOMIS_PYTEST_CACHE_FOLDER,
+    )
+
+
+@pytest.fixture(scope="session")
 def uk_sector_letter_codes() -> tuple[str, ...]:
     """Return a tuple of uppercase UK sector code `strs`."""
     return tuple(ascii_uppercase[:21])
 
 
 @pytest.fixture(scope="session")
-def three_cities() -> dict[str, str]:
-    """Return a `dict` of cities to regions they occupy."""
-    return THREE_UK_CITY_REGIONS
+def three_cities() -> MappingProxyType[str, str]:
+    """Return a read-only view of cities to regions they occupy.
+
+    Note:
+        Use `dict(three_cities)` where a mutable `dict` is needed, like
+        model `regions` which are copied and may be changed.
+    """
+    from estios.uk.utils import THREE_UK_CITY_REGIONS
+
+    return MappingProxyType(THREE_UK_CITY_REGIONS)
 
 
 @pytest.fixture(scope="session")
@@ -131,159 +448,349 @@ def three_city_names(three_cities) -> tuple[str, ...]:
     return tuple(three_cities.keys())
 
 
-@pytest.fixture
-def ten_sector_aggregation_dict() -> dict[str, Sequence[str]]:
-    """Return a `dict` of aggregation names to relevant sectors."""
-    return SECTOR_10_CODE_DICT
+@pytest.fixture(scope="session")
+def ten_sector_aggregation_dict() -> MappingProxyType[str, Sequence[str]]:
+    """Return a read-only view of aggregation names to relevant sectors."""
+    return MappingProxyType(SECTOR_10_CODE_DICT)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ten_sector_aggregation_names() -> tuple[str, ...]:
     """Return a `tuple` of sector aggregation names."""
     return tuple(SECTOR_10_CODE_DICT.keys())
 
 
-@pytest.fixture
-def region_geo_data() -> GeoDataFrame:
-    """Return import and return spatial date from Centre for Cities."""
+@pytest.fixture(scope="session")
+def _region_geo_data_cached() -> GeoDataFrame:
+    """Return import and return spatial date from Centre for Cities once."""
+    from estios.uk.regions import load_and_join_centre_for_cities_data
+
     return load_and_join_centre_for_cities_data()
 
 
+@pytest.fixture
+def region_geo_data(_region_geo_data_cached: GeoDataFrame) -> GeoDataFrame:
+    """Return a copy of spatial date from Centre for Cities."""
+    return _region_geo_data_cached.copy()
+
+
 @pytest.fixture(scope="session")
-def three_cities_io(three_cities: dict[str, str]) -> InterRegionInputOutputUK2017:
-    """Return an `InterRegionInputOutputUK2017` from `three_cities` fixture."""
-    return InterRegionInputOutputUK2017(regions=three_cities)
+def _three_cities_io_template(
+    three_cities: MappingProxyType[str, str]
+) -> InterRegionInputOutputUK2017:
+    """Return an `InterRegionInputOutputUK2017` from `three_cities` once."""
+    from estios.uk.models import InterRegionInputOutputUK2017
+
+    return InterRegionInputOutputUK2017(regions=dict(three_cities))
+
+
+@pytest.fixture
+def three_cities_io(
+    request: pytest.FixtureRequest,
+    _three_cities_io_template: InterRegionInputOutputUK2017,
+) -> InterRegionInputOutputUK2017:
+    """Return an `InterRegionInputOutputUK2017` from `three_cities` fixture.
+
+    Note:
+        Tests marked `mutates_io` get a `deepcopy`, all others share the
+        `_three_cities_io_template` instance.
+    """
+    if request.node.get_closest_marker("mutates_io"):
+        return deepcopy(_three_cities_io_template)
+    return _three_cities_io_template
 
 
 @pytest.mark.remote_data
 @pytest.mark.nomis
 @pytest.fixture(scope="session")
 def three_cities_results(
-    three_cities_io: InterRegionInputOutputUK2017,
+    _three_cities_io_template: InterRegionInputOutputUK2017,
     tmp_path_factory: pytest.TempPathFactory,
     worker_id: str,
 ) -> InterRegionInputOutput:
-    """Three cities convergence results fixture."""
-    # three_cities_io.import_export_convergence()
-    # xdist_session_data_wrapper(
-    #     tmp_path_factory=tmp_path_factory,
-    #     worker_id=worker_id,
-    #     func=
-    #
-    # )
-    three_cities_io.import_export_convergence()
-    return three_cities_io
+    """Three cities convergence results fixture.
 
+    Convergence is the slowest fixture step, so under `xdist` only one
+    worker runs it and the others load its pickled results. A copy is
+    converged, so `three_cities_io` is unconverged in every worker.
+    """
 
-@pytest.fixture
-def quarterly_2017_employment_dates():
-    """Return example employment config for all quarters of 2017."""
-    return generate_employment_quarterly_dates(
-        [
-            2017,
-        ]
+    def converge() -> InterRegionInputOutputUK2017:
+        three_cities_io: InterRegionInputOutputUK2017 = deepcopy(
+            _three_cities_io_template
+        )
+        three_cities_io.import_export_convergence()
+        return three_cities_io
+
+    return xdist_session_data_wrapper(
+        tmp_path_factory=tmp_path_factory,
+        worker_id=worker_id,
+        func=converge,
+        include_fixture_path=False,
+        file_name="three_cities_results.pkl",
     )
 
 
-@pytest.fixture
-def all_cities() -> dict[str, str]:
-    """Return example config of all enabled Centre for Cities spec."""
-    return get_all_centre_for_cities_dict()
+@pytest.fixture(scope="session")
+def _three_cities_axes(three_cities: MappingProxyType[str, str]) -> SimpleNamespace:
+    """Return `three_cities_io` `sectors`, `sector_names` and `i_m_index`.
+
+    These follow `InterRegionInputOutputUK2017` defaults rather than reading
+    them from a model, so reference fixtures get their indexes without
+    loading the IO table. `sector_names` is the same `Index` object as
+    `sectors`, as they are equal for the default `SECTOR_10_CODE_DICT`
+    aggregation.
+    """
+    from estios.uk.utils import UK_NATIONAL_COLUMN_NAME
+
+    return SimpleNamespace(
+        sectors=_SECTOR_10_INDEX,
+        sector_names=_SECTOR_10_INDEX,
+        i_m_index=generate_i_m_index(
+            list(three_cities), _SECTOR_10_INDEX, UK_NATIONAL_COLUMN_NAME
+        ),
+    )
 
 
-@pytest.fixture
-def all_cities_io(all_cities: dict[str, str]) -> InterRegionInputOutput:
+@pytest.fixture(scope="session")
+def quarterly_2017_employment_dates() -> tuple[date, ...]:
+    """Return example employment config for all quarters of 2017.
+
+    Note:
+        `generate_employment_quarterly_dates` returns a `Generator`, so
+        results are stored in a `tuple` to reuse across the session.
+    """
+    from estios.uk.ons_employment_2017 import generate_employment_quarterly_dates
+
+    return tuple(
+        generate_employment_quarterly_dates(
+            [
+                2017,
+            ]
+        )
+    )
+
+
+@pytest.fixture(scope="session")
+def all_cities() -> MappingProxyType[str, str]:
+    """Return a read-only view of all enabled Centre for Cities spec."""
+    from estios.uk.regions import get_all_centre_for_cities_dict
+
+    return MappingProxyType(get_all_centre_for_cities_dict())
+
+
+@pytest.fixture(scope="session")
+def all_cities_io(all_cities: MappingProxyType[str, str]) -> InterRegionInputOutput:
     """Return `InterRegionInputOutputUK2017` for all enabled Centre for Cities spec."""
-    return InterRegionInputOutputUK2017(regions=all_cities)
+    from estios.uk.models import InterRegionInputOutputUK2017
+
+    return InterRegionInputOutputUK2017(regions=dict(all_cities))
 
 
 @pytest.fixture
-def three_cities_2018_2043(three_cities) -> InterRegionInputOutputTimeSeries:
-    """Return `InterRegionInputOutputUK2017` for `three_cities` 2018-2043 projections."""
+def all_cities_io_fresh(
+    all_cities_io: InterRegionInputOutput,
+) -> InterRegionInputOutput:
+    """Return a `deepcopy` of `all_cities_io` for tests that modify it."""
+    return deepcopy(all_cities_io)
+
+
+@pytest.fixture(scope="session")
+def _three_cities_2018_2043_template(
+    three_cities: MappingProxyType[str, str],
+    ons_cpa_io_table: InputOutputTableUK2017,
+) -> InterRegionInputOutputTimeSeries:
+    """Return `three_cities` 2018-2043 projections, built once per session.
+
+    Note:
+        Models process their `raw_io_table` and converge in place, so tests
+        use copies from `three_cities_2018_2043` or `three_cities_2018_2020`.
+        All models share the already parsed `ons_cpa_io_table` `raw_io_table`
+        rather than each reading the `ONS` spreadsheet. Each still converts it
+        to an `InputOutputTable` with its own `date`, which does not modify
+        the shared `DataFrame`.
+    """
+    from estios.uk.ons_population_projections import ONS_PROJECTION_YEARS
+    from estios.uk.scenarios import annual_io_time_series_ons_2017
+
     return annual_io_time_series_ons_2017(
-        annual_config=ONS_PROJECTION_YEARS, regions=three_cities
+        annual_config=ONS_PROJECTION_YEARS,
+        regions=dict(three_cities),
+        raw_io_table=ons_cpa_io_table.raw_io_table,
     )
 
 
 @pytest.fixture
-def three_cities_2018_2020(three_cities) -> InterRegionInputOutputTimeSeries:
+def three_cities_2018_2043(
+    _three_cities_2018_2043_template: InterRegionInputOutputTimeSeries,
+) -> InterRegionInputOutputTimeSeries:
+    """Return `InterRegionInputOutputUK2017` for `three_cities` 2018-2043 projections."""
+    return deepcopy(_three_cities_2018_2043_template)
+
+
+@pytest.fixture
+def three_cities_2018_2020(
+    _three_cities_2018_2043_template: InterRegionInputOutputTimeSeries,
+) -> InterRegionInputOutputTimeSeries:
     """Return `InterRegionInputOutputUK2017` for `three_cities` 2018-2021 projections."""
-    return annual_io_time_series_ons_2017(
-        annual_config=range(2018, 2021), regions=three_cities
+    return replace(
+        _three_cities_2018_2043_template,
+        io_models=deepcopy(
+            [
+                io_model
+                for io_model in _three_cities_2018_2043_template
+                if io_model.year < 2021
+            ]
+        ),
     )
 
 
-@pytest.fixture
-def ons_cpa_io_table() -> InputOutputTableUK2017:
-    """Return default `InputOutputTableUK2017` configuration instance."""
-    return InputOutputTableUK2017()
+@pytest.fixture(scope="session")
+def ons_cpa_io_table(pytestconfig: pytest.Config) -> InputOutputTableUK2017:
+    """Return default `InputOutputTableUK2017` configuration instance.
 
+    Note:
+        This is shared across tests, none of which currently modify it. Only
+        the parsed `ONS` spreadsheet is cached between sessions, so the
+        `InputOutputTableUK2017` processing of it runs every session.
+    """
+    from estios.uk.input_output_tables import InputOutputTableUK2017
+    from estios.uk.ons_IO_2017 import ONS_IO_TABLE_2017_METADATA
+
+    def _read_io_spreadsheet() -> DataFrame:
+        return ONS_IO_TABLE_2017_METADATA.read(apply_post_read_func=False)
+
+    assert ONS_IO_TABLE_2017_METADATA.url
+    io_spreadsheet: DataFrame = cached_pandas_read(
+        pytestconfig.cache,
+        key=(
+            f"{ONS_IO_TABLE_2017_METADATA.url}-"
+            f"{ONS_IO_TABLE_2017_METADATA._reader_kwargs!r}"
+        ),
+        read_func=_read_io_spreadsheet,
+    )
 
-@pytest.fixture
+    def _copy_io_spreadsheet(*args, **kwargs) -> DataFrame:
+        return io_spreadsheet.copy()
+
+    return InputOutputTableUK2017(
+        raw_io_table=ONS_IO_TABLE_2017_METADATA.clone(_reader_func=_copy_io_spreadsheet)
+    )
+
+
+@pytest.fixture(scope="session")
 def month_day() -> MonthDay:
     """Return a `MondayDay` instance for date configuration."""
     return MonthDay()
 
 
-def _pop_projection_fixture(tmp_path_factory) -> Generator[MetaData, None, None]:
-    """Extract ONS population projection for testing and remove when concluded."""
-    pop_projection: MetaData = ONS_ENGLAND_POPULATION_META_DATA
-    # pop_projection.auto_download = True
-    pop_projection._package_data = False
-    pop_projection.set_folder(tmp_path_factory.mktemp("test-session"))
-    pop_projection.save_local()
-    yield pop_projection
-    pop_projection.delete_local()
+@pytest.fixture(scope="session")
+def pop_projection(pytestconfig: pytest.Config) -> MetaData:
+    """Return ONS population projection `MetaData` saved in the `pytest` cache.
 
+    The projection is downloaded once and kept between sessions, with a
+    `FileLock` so only one `xdist` worker downloads. Run
+    `pytest --cache-clear` to download it again.
+    """
+    from estios.uk.ons_population_projections import ONS_ENGLAND_POPULATION_META_DATA
 
-@pytest.fixture(scope="session")
-def pop_projection(tmp_path_factory, worker_id):
-    """Yield population projections from `_pop_projection_fixture`."""
-    yield from xdist_session_data_wrapper(
-        tmp_path_factory=tmp_path_factory,
-        worker_id=worker_id,
-        func=_pop_projection_fixture,
-        is_generator=True,
-        include_fixture_path=True,
+    pop_projection: MetaData = ONS_ENGLAND_POPULATION_META_DATA.clone(
+        _package_data=False
     )
+    pop_projection.set_folder(pytestconfig.cache.mkdir(ESTIOS_PYTEST_CACHE_FOLDER))
+    with FileLock(f"{pop_projection.absolute_save_path}.lock"):
+        if not pop_projection.is_local:
+            try:
+                pop_projection.save_local()
+            except Exception:
+                if pop_projection.is_local:
+                    pop_projection.delete_local()
+                raise
+    return pop_projection
 
 
 @pytest.fixture(scope="session")
-def english_pop_projections(pop_projection) -> Generator[MetaData, None, None]:
-    """Extract ONS population projection as DataFrame."""
-    assert isinstance(pop_projection, MetaData)
-    yield pop_projection.read()
+def english_pop_projections(_ons_projection_full: DataFrame) -> DataFrame:
+    """Extract ONS population projection as DataFrame, cached between sessions.
+
+    Note:
+        This is the `_ons_projection_full` `DataFrame`, so the projection is
+        parsed and cached once for these tests and `ONSPopulationProjection`
+        fixtures. Tests aggregate across all regions and ages, so a lazily
+        evaluated frame would still be fully loaded.
+    """
+    return _ons_projection_full
 
 
 @pytest.fixture(scope="session")
-def uk_pua_manager(tmp_path_factory, worker_id) -> PUASManager:
-    """Return default `PUASManager` for working UK cities."""
-    puas_manager: Generator[
-        PUASManager | GenericRegionsManager, None, None
-    ] = xdist_session_data_wrapper(
-        tmp_path_factory=tmp_path_factory,
-        func=generate_uk_puas,
-        worker_id=worker_id,
-        is_generator=False,
-        include_fixture_path=False,
+def uk_pua_manager(pytestconfig: pytest.Config) -> PUASManager:
+    """Return default `PUASManager` for UK cities, cached between sessions.
+
+    Note:
+        The cache key includes the modules `generate_uk_puas` builds regions
+        with and the `ONS` population file it reads, so changes to either
+        rebuild the `PUASManager`.
+    """
+    from estios import spatial
+    from estios.uk import centre_for_cities_puas, ons_population_estimates, regions
+    from estios.uk import utils as uk_utils
+    from estios.uk.ons_population_estimates import (
+        ONS_CONTEMPORARY_POPULATION_META_DATA,
+    )
+    from estios.uk.utils import generate_uk_puas
+
+    sources_key: str = _sources_key(
+        spatial,
+        centre_for_cities_puas,
+        ons_population_estimates,
+        regions,
+        uk_utils,
+        ONS_CONTEMPORARY_POPULATION_META_DATA.absolute_save_path,
+    )
+    return cached_pickle(
+        pytestconfig.cache,
+        key=f"{generate_uk_puas.__qualname__}-{sources_key}",
+        build_func=generate_uk_puas,
     )
-    if isinstance(puas_manager, Generator):
-        assert False
-        yield from puas_manager
-    else:
-        return puas_manager
 
 
 @pytest.fixture(scope="session")
-def working_puas_manager() -> PUASManager:
+def working_puas_manager(uk_pua_manager: PUASManager) -> PUASManager:
     """Return a `PUASManager` for all cities categorised as `working`."""
-    return get_working_cities_puas_manager()
+    from estios.uk.utils import get_working_cities_puas_manager
 
+    return get_working_cities_puas_manager(deepcopy(uk_pua_manager))
 
-@pytest.fixture
-def ons_2018_projection(pop_projection, three_cities) -> ONSPopulationProjection:
+
+@pytest.fixture(scope="session")
+def _ons_projection_full(
+    pop_projection: MetaData, pytestconfig: pytest.Config
+) -> DataFrame:
+    """Return all `pop_projection` age projections, cached between sessions.
+
+    `ONSPopulationProjection` only reads `meta_data` if `age_projections` is
+    not passed, and does not modify it, so region subsets can share this.
+    """
+    assert pop_projection.url
+    return cached_pandas_read(
+        pytestconfig.cache,
+        key=f"{pop_projection.url}-{Path(str(pop_projection.path)).name}",
+        read_func=pop_projection.read,
+    )
+
+
+@pytest.fixture(scope="session")
+def ons_2018_projection(
+    pop_projection, _ons_projection_full, three_cities
+) -> ONSPopulationProjection:
     """Return `ONSPopulationProjection` for `three_cities` from 2018."""
-    return ONSPopulationProjection(regions=three_cities, meta_data=pop_projection)
+    from estios.uk.ons_population_projections import ONSPopulationProjection
+
+    return ONSPopulationProjection(
+        regions=dict(three_cities),
+        meta_data=pop_projection,
+        age_projections=_ons_projection_full,
+    )
 
 
 @pytest.fixture(scope="session")
@@ -294,127 +801,285 @@ def york_leeds_bristol() -> list[str]:
 
 @pytest.fixture(scope="session")
 def ons_york_leeds_bristol_projection(
-    pop_projection, york_leeds_bristol
+    pop_projection, _ons_projection_full, york_leeds_bristol
 ) -> ONSPopulationProjection:
     """Return `ONSPopulationProjection` for York, Leeds and Bristol."""
-    return ONSPopulationProjection(regions=york_leeds_bristol, meta_data=pop_projection)
+    from estios.uk.ons_population_projections import ONSPopulationProjection
+
+    return ONSPopulationProjection(
+        regions=york_leeds_bristol,
+        meta_data=pop_projection,
+        age_projections=_ons_projection_full,
+    )
 
 
 @pytest.fixture(scope="session")
-def pop_history(tmp_path_factory) -> Generator[DataFrame, None, None]:
-    """Extract ONS population history to test and remove when concluded."""
-    pop_history: MetaData = ONS_UK_POPULATION_HISTORY_META_DATA
-    pop_history.set_folder(tmp_path_factory.mktemp("test-session"))
-    pop_history.save_local()
-    yield pop_history.read()
-    pop_history.delete_local()
+def pop_history(_session_scratch: Path, pytestconfig: pytest.Config) -> DataFrame:
+    """Extract ONS population history, cached between sessions."""
+    from estios.uk.ons_uk_population_history import (
+        ONS_UK_POPULATION_HISTORY_META_DATA,
+    )
 
+    def _read_pop_history() -> DataFrame:
+        pop_history: MetaData = ONS_UK_POPULATION_HISTORY_META_DATA.clone(
+            folder=_scratch_subdir(_session_scratch, "pop-history")
+        )
+        pop_history.save_local()
+        pop_history_df: DataFrame = pop_history.read()
+        pop_history.delete_local()
+        return pop_history_df
+
+    assert ONS_UK_POPULATION_HISTORY_META_DATA.url
+    return cached_pandas_read(
+        pytestconfig.cache,
+        key=ONS_UK_POPULATION_HISTORY_META_DATA.url,
+        read_func=_read_pop_history,
+    )
 
-@pytest.fixture
-def pop_recent() -> DataFrame:
-    """Return contemporary `ONS` populations."""
-    return load_contemporary_ons_population()
 
+@pytest.fixture(scope="session")
+def pop_recent(pytestconfig: pytest.Config) -> DataFrame:
+    """Return contemporary `ONS` populations, cached between sessions."""
+    from estios.uk.ons_population_estimates import (
+        ONS_CONTEMPORARY_POPULATION_META_DATA,
+    )
+    from estios.uk.utils import load_contemporary_ons_population
 
-@pytest.fixture
-def correct_three_cities_pop_2017() -> Series:
+    assert ONS_CONTEMPORARY_POPULATION_META_DATA.url
+    return cached_pandas_read(
+        pytestconfig.cache,
+        key=ONS_CONTEMPORARY_POPULATION_META_DATA.url,
+        read_func=load_contemporary_ons_population,
+    )
+
+
+_THREE_CITIES_POP_2017_VALUES: Final[ndarray] = _read_only_array(
+    [784846, 640109, 2474149], dtype="int64"
+)
+
+
+@pytest.fixture(scope="session")
+def correct_three_cities_pop_2017(three_city_names: tuple[str, ...]) -> Series:
     """Three cities population aggregated from PUAs.
 
     Todo:
         * Worth double checking this aggregation.
     """
-    return Series(
-        {
-            "Leeds": 784846,
-            "Liverpool": 640109,
-            "Manchester": 2474149,
-        }
+    return Series(_THREE_CITIES_POP_2017_VALUES, index=three_city_names)
+
+
+@pytest.mark.remote_data
+@pytest.mark.nomis
+@pytest.fixture(scope="session")
+def _nomis_2017_queries(_nomis_scratch: Path) -> dict[str, Future[DataFrame]]:
+    """Return `Futures` of the 2017 regional and national `NOMIS` queries.
+
+    Both queries are independent, so are sent concurrently to overlap waiting
+    on the `NOMIS` API. Each query is passed a copy of its `query_params` as
+    `nomis_query` sets their `date`. `nomis_query` reuses results saved in
+    `_nomis_scratch`, so each query holds a lock for `xdist` workers to share.
+    Tests using this are skipped at collection if `NOMIS_API_KEY` is not set
+    (see `pytest_collection_modifyitems`).
+    """
+    from estios.uk.nomis_contemporary_employment import (
+        NOMIS_API_KEY,
+        NOMIS_LETTER_SECTOR_QUERY_PARAM_DICT,
+        NOMIS_NATIONAL_EMPLOYMENT_TABLE_CODE,
+        NOMIS_NATIONAL_LETTER_SECTOR_QUERY_PARAM_DICT,
+        NOMIS_SECTOR_EMPLOYMENT_TABLE_CODE,
+        gen_date_query,
+        nomis_query,
     )
 
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        return {
+            "regional": executor.submit(
+                _locked_call,
+                _nomis_scratch / "regional",
+                nomis_query,
+                2017,
+                nomis_table_code=NOMIS_SECTOR_EMPLOYMENT_TABLE_CODE,
+                query_params=dict(NOMIS_LETTER_SECTOR_QUERY_PARAM_DICT),
+                download_path=_nomis_scratch,
+                api_key=NOMIS_API_KEY,
+            ),
+            "national": executor.submit(
+                _locked_call,
+                _nomis_scratch / "national",
+                nomis_query,
+                2017,
+                nomis_table_code=NOMIS_NATIONAL_EMPLOYMENT_TABLE_CODE,
+                query_params=dict(NOMIS_NATIONAL_LETTER_SECTOR_QUERY_PARAM_DICT),
+                download_path=_nomis_scratch,
+                date_func=gen_date_query,
+                api_key=NOMIS_API_KEY,
+            ),
+        }
+
 
 @pytest.mark.remote_data
 @pytest.fixture(scope="session")
-def nomis_2017_regional_employment_raw(tmp_path_factory) -> DataFrame:
+def nomis_2017_regional_employment_raw(
+    _nomis_2017_queries: dict[str, Future[DataFrame]]
+) -> DataFrame:
     """Return `NOMIS` 2017 population estimates."""
-    return nomis_query(
-        2017,
-        nomis_table_code=NOMIS_SECTOR_EMPLOYMENT_TABLE_CODE,
-        query_params=NOMIS_LETTER_SECTOR_QUERY_PARAM_DICT,
-        download_path=tmp_path_factory.mktemp("test-nomis"),
-    )
+    return _nomis_2017_queries["regional"].result()
 
 
 @pytest.mark.remote_data
 @pytest.mark.nomis
 @pytest.fixture(scope="session")
-def nomis_2017_regional_employment_filtered(tmp_path_factory) -> DataFrame:
-    """Return `NOMIS` 2017 regional population estimates filtered."""
-    try:
-        api_key = NOMIS_API_KEY
-        assert api_key
-    except KeyError:
-        raise APIKeyNomisError(
-            f"To run these tests a `NOMIS_API_KEY` is required in `.env`"
-        )
-    return clean_nomis_employment_query(
-        2017, download_path=tmp_path_factory.mktemp("test-nomis"), api_key=api_key
-    )
+def nomis_2017_regional_employment_filtered(
+    nomis_2017_regional_employment_raw: DataFrame,
+) -> DataFrame:
+    """Return `NOMIS` 2017 regional population estimates filtered.
+
+    Note:
+        This is equivalent to `clean_nomis_employment_query(2017)`, reusing
+        the `nomis_2017_regional_employment_raw` query results.
+    """
+    from estios.uk.nomis_contemporary_employment import trim_df_for_employment_count
+
+    return trim_df_for_employment_count(nomis_2017_regional_employment_raw)
 
 
 @pytest.fixture(scope="session")
-def ten_city_names(ten_regions: dict = TEN_UK_CITY_REGIONS) -> tuple[str, ...]:
+def ten_city_names() -> tuple[str, ...]:
     """Return a `tuple` of all the `TEN_UK_CITY_REGIONS` names."""
-    return tuple(ten_regions.keys())
+    from estios.uk.regions import TEN_UK_CITY_REGIONS
+
+    return tuple(TEN_UK_CITY_REGIONS.keys())
+
+
+def _read_nomis_2017_employment(
+    meta_data: MetaData,
+    folder: Path,
+    query_name: str,
+    region_names: Sequence[str] | None = None,
+) -> DataFrame:
+    """Return `read()` results of a copy of `meta_data` saved in `folder`.
+
+    `meta_data` is only queried if not already saved in `folder`, so
+    fixtures filtering the same query by `region_names` share one download.
+    Only the columns the `NOMIS` filter functions use are parsed.
+
+    Args:
+        meta_data:
+            `NOMIS` `MetaData` configuration to copy and `read()`
+        folder:
+            path to save `NOMIS` query results to
+        query_name:
+            `regional` or `national`, naming the lock in `folder` shared
+            with `_nomis_2017_queries`, as both save the same query there
+        region_names:
+            optional region names to filter results by
+
+    Returns:
+        A `DataFrame` of `NOMIS` employment results
+    """
+    from estios.uk.nomis_contemporary_employment import (
+        NOMIS_GEOGRAPHY_CODE_COLUMN_NAME,
+        NOMIS_GEOGRAPHY_NAME_COLUMN_NAME,
+        NOMIS_INDUSTRY_CODE_COLUMN_NAME,
+        NOMIS_OBSERVATION_VALUE_COLUMN_NAME,
+    )
+
+    reader_kwargs: dict[str, Any] = dict(
+        read_kwargs=dict(
+            usecols=[
+                NOMIS_GEOGRAPHY_CODE_COLUMN_NAME,
+                NOMIS_GEOGRAPHY_NAME_COLUMN_NAME,
+                NOMIS_INDUSTRY_CODE_COLUMN_NAME,
+                NOMIS_OBSERVATION_VALUE_COLUMN_NAME,
+            ],
+            dtype={
+                NOMIS_GEOGRAPHY_CODE_COLUMN_NAME: str,
+                NOMIS_INDUSTRY_CODE_COLUMN_NAME: str,
+            },
+        )
+    )
+    if region_names:
+        reader_kwargs["region_names"] = region_names
+    nomis_meta_data: MetaData = meta_data.clone(
+        auto_download=False,
+        reader_kwargs=reader_kwargs,
+        folder=folder,
+        _api_kwargs=meta_data._api_kwargs | dict(download_path=folder),
+    )
+    with FileLock(f"{folder / query_name}.lock"):
+        if not nomis_meta_data.is_local:
+            nomis_meta_data.save_local()
+    return nomis_meta_data.read()
 
 
 @pytest.mark.remote_data
 @pytest.mark.nomis
 @pytest.fixture(scope="session")
-def nomis_2017_10_cities_employment(tmp_path_factory, ten_city_names) -> DataFrame:
+def nomis_2017_10_cities_employment(_nomis_scratch, ten_city_names) -> DataFrame:
     """Return a `DataFrame` of `TEN_UK_CITY_REGIONS` from 2017 NOMIS employment tables."""
-    regional_employment_nomis_2017 = deepcopy(NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA)
-    regional_employment_nomis_2017.path = "10-cities-test.csv"
-    regional_employment_nomis_2017.set_folder(tmp_path_factory.mktemp("test-nomis"))
-    regional_employment_nomis_2017._reader_kwargs["region_names"] = ten_city_names
-    return regional_employment_nomis_2017.read()
+    from estios.uk.populations import NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA
+
+    return _read_nomis_2017_employment(
+        NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA,
+        folder=_nomis_scratch,
+        query_name="regional",
+        region_names=ten_city_names,
+    )
 
 
 @pytest.mark.remote_data
 @pytest.mark.nomis
 @pytest.fixture(scope="session")
-def nomis_2017_3_cities_employment(tmp_path_factory, three_city_names) -> DataFrame:
+def nomis_2017_3_cities_employment(_nomis_scratch, three_city_names) -> DataFrame:
     """Return a `DataFrame` of `TEN_CITIES` from 2017 NOMIS employment tables."""
-    regional_employment_nomis_2017 = deepcopy(NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA)
-    regional_employment_nomis_2017.path = "3-cities-test.csv"
-    regional_employment_nomis_2017.set_folder(tmp_path_factory.mktemp("test-nomis"))
-    regional_employment_nomis_2017._reader_kwargs["region_names"] = three_city_names
-    return regional_employment_nomis_2017.read()
+    from estios.uk.populations import NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA
+
+    return _read_nomis_2017_employment(
+        NOMIS_REGIONAL_EMPLOYMENT_2017_METADATA,
+        folder=_nomis_scratch,
+        query_name="regional",
+        region_names=three_city_names,
+    )
 
 
 @pytest.mark.remote_data
 @pytest.mark.nomis
 @pytest.fixture(scope="session")
-def nomis_2017_national_employment(tmp_path_factory) -> DataFrame:
+def nomis_2017_national_employment(_nomis_scratch) -> DataFrame:
     """Return 2017 national employment from a NOMIS query saved locally."""
-    national_nomis_2017 = deepcopy(NOMIS_NATIONAL_EMPLOYMENT_2017_METADATA)
-    national_nomis_2017.set_folder(tmp_path_factory.mktemp("test-nomis"))
-    return national_nomis_2017.read()
+    from estios.uk.populations import NOMIS_NATIONAL_EMPLOYMENT_2017_METADATA
+
+    return _read_nomis_2017_employment(
+        NOMIS_NATIONAL_EMPLOYMENT_2017_METADATA,
+        folder=_nomis_scratch,
+        query_name="national",
+    )
 
 
 @pytest.mark.remote_data
 @pytest.mark.nomis
 @pytest.fixture(scope="session")
-def nomis_2017_nation_employment_table(tmp_path_factory) -> DataFrame:
-    """Return a `DataFrame` of 2017 national employment from NOMIS."""
-    try:
-        api_key = NOMIS_API_KEY
-        assert api_key
-    except KeyError:
-        raise APIKeyNomisError(
-            f"To run these tests a `NOMIS_API_KEY` is required in `.env`"
-        )
-    return national_employment_query(
-        2017, download_path=tmp_path_factory.mktemp("test-nomis"), api_key=api_key
+def nomis_2017_nation_employment_table(
+    _nomis_2017_queries: dict[str, Future[DataFrame]]
+) -> DataFrame:
+    """Return a `DataFrame` of 2017 national employment from NOMIS.
+
+    Note:
+        This is equivalent to `national_employment_query(2017)`, reusing the
+        concurrent `_nomis_2017_queries` results.
+    """
+    from estios.uk.nomis_contemporary_employment import (
+        NOMIS_ALL_SEXES_VALUE,
+        NOMIS_TOTAL_WORKFORCE_VALUE,
+        trim_df_for_employment_count,
+    )
+
+    return trim_df_for_employment_count(
+        _nomis_2017_queries["national"].result(),
+        first_column_name="SEX_NAME",
+        first_value=NOMIS_ALL_SEXES_VALUE,
+        second_column_name="ITEM_NAME",
+        second_value=NOMIS_TOTAL_WORKFORCE_VALUE,
     )
 
 
@@ -430,118 +1095,173 @@ def nomis_2017_nation_employment_table(tmp_path_factory) -> DataFrame:
 #     return baseline_england_annual_projection()
 
 
-@pytest.fixture
-def correct_uk_ons_X_m_national(three_cities_io) -> Series:
+# Expected results for session scoped `correct_*` fixtures, shared by all
+# tests. Values are read-only via `_read_only_array`: call `.copy()` on a
+# `correct_*` fixture before modifying it within a test.
+
+_UK_ONS_X_M_NATIONAL_VALUES: Final[ndarray] = _read_only_array(
+    [
+        289442470348.79114,
+        5818450168143.932,
+        3153488889821.8154,
+        6323216068010.093,
+        1899522593822.1008,
+        2913907428507.6763,
+        3528332764358.8877,
+        4411504653869.348,
+        5181479466207.092,
+        954735496910.265,
+    ],
+    dtype="float64",
+)
+
+
+@pytest.fixture(scope="session")
+def correct_uk_ons_X_m_national(_three_cities_axes) -> Series:
     """Example X_m_national talies for testing."""
     return Series(
-        [
-            289442470348.79114,
-            5818450168143.932,
-            3153488889821.8154,
-            6323216068010.093,
-            1899522593822.1008,
-            2913907428507.6763,
-            3528332764358.8877,
-            4411504653869.348,
-            5181479466207.092,
-            954735496910.265,
-        ],
-        index=three_cities_io.sectors,
+        _UK_ONS_X_M_NATIONAL_VALUES,
+        index=_three_cities_axes.sectors,
     )
 
 
-@pytest.fixture
-def correct_uk_ons_I_m_national(three_cities_io) -> Series:
+_UK_ONS_I_M_NATIONAL_VALUES: Final[ndarray] = _read_only_array(
+    [
+        1850000000.0,
+        198110000000.0,
+        1728440000000.0,
+        163120000000.0,
+        438970000000.0,
+        0.0,
+        80870000000.0,
+        406090000000.0,
+        11640000000.0,
+        2320000000.0,
+    ],
+    dtype="float64",
+)
+
+
+@pytest.fixture(scope="session")
+def correct_uk_ons_I_m_national(_three_cities_axes) -> Series:
     """Example I_m_national talies for testing."""
     return Series(
-        [
-            1850000000.0,
-            198110000000.0,
-            1728440000000.0,
-            163120000000.0,
-            438970000000.0,
-            0.0,
-            80870000000.0,
-            406090000000.0,
-            11640000000.0,
-            2320000000.0,
-        ],
-        index=three_cities_io.sectors,
+        _UK_ONS_I_M_NATIONAL_VALUES,
+        index=_three_cities_axes.sectors,
     )
 
 
-@pytest.fixture
-def correct_uk_ons_S_m_national(three_cities_io) -> Series:
+_UK_ONS_S_M_NATIONAL_VALUES: Final[ndarray] = _read_only_array(
+    [
+        5196999131.544732,
+        53157445243.01777,
+        66320083087.75002,
+        119344853583.39317,
+        6459042512.359258,
+        125403792201.85165,
+        13459242236.748169,
+        21639857794.041252,
+        180650767090.27383,
+        22847917119.020103,
+    ],
+    dtype="float64",
+)
+
+
+@pytest.fixture(scope="session")
+def correct_uk_ons_S_m_national(_three_cities_axes) -> Series:
     """Example S_m_national talies for testing."""
     return Series(
-        [
-            5196999131.544732,
-            53157445243.01777,
-            66320083087.75002,
-            119344853583.39317,
-            6459042512.359258,
-            125403792201.85165,
-            13459242236.748169,
-            21639857794.041252,
-            180650767090.27383,
-            22847917119.020103,
-        ],
-        index=three_cities_io.sectors,
+        _UK_ONS_S_M_NATIONAL_VALUES,
+        index=_three_cities_axes.sectors,
     )
 
 
-@pytest.fixture
-def correct_uk_ons_E_m_national(three_cities_io) -> DataFrame:
+_UK_ONS_E_M_NATIONAL_EXPORTS_TO_EU: Final[ndarray] = _read_only_array(
+    [
+        16290000000.0,
+        1009680000000.0,
+        0.0,
+        261910000000.0,
+        15480000000.0,
+        0.0,
+        0.0,
+        260000000.0,
+        0.0,
+        160000000.0,
+    ],
+    dtype="float64",
+)
+_UK_ONS_E_M_NATIONAL_EXPORTS_OUTSIDE_EU: Final[ndarray] = _read_only_array(
+    [
+        6690000000.0,
+        936150000000.0,
+        0.0,
+        237590000000.0,
+        13800000000.0,
+        0.0,
+        0.0,
+        70000000.0,
+        0.0,
+        48090000000.0,
+    ],
+    dtype="float64",
+)
+_UK_ONS_E_M_NATIONAL_EXPORTS_OF_SERVICES: Final[ndarray] = _read_only_array(
+    [
+        1740000000.0,
+        111400000000.0,
+        27190000000.0,
+        431360000000.0,
+        376810000000.0,
+        873470000000.0,
+        20010000000.0,
+        1113280000000.0,
+        114630000000.0,
+        23610000000.0,
+    ],
+    dtype="float64",
+)
+
+
+@pytest.fixture(scope="session")
+def correct_uk_ons_E_m_national(_three_cities_axes) -> DataFrame:
     """Example S_m_national talies for testing.
 
     Todo:
         * Check results currently commented out.
     """
-    return DataFrame(
-        {
-            "Exports to EU": [
-                16290000000.0,
-                1009680000000.0,
-                0.0,
-                261910000000.0,
-                15480000000.0,
-                0.0,
-                0.0,
-                260000000.0,
-                0.0,
-                160000000.0,
-            ],
-            "Exports outside EU": [
-                6690000000.0,
-                936150000000.0,
-                0.0,
-                237590000000.0,
-                13800000000.0,
-                0.0,
-                0.0,
-                70000000.0,
-                0.0,
-                48090000000.0,
-            ],
-            "Exports of services": [
-                1740000000.0,
-                111400000000.0,
-                27190000000.0,
-                431360000000.0,
-                376810000000.0,
-                873470000000.0,
-                20010000000.0,
-                1113280000000.0,
-                114630000000.0,
-                23610000000.0,
-            ],
-        },
-        index=three_cities_io.sector_names,
+    return _read_only_frame(
+        DataFrame(
+            {
+                "Exports to EU": _UK_ONS_E_M_NATIONAL_EXPORTS_TO_EU,
+                "Exports outside EU": _UK_ONS_E_M_NATIONAL_EXPORTS_OUTSIDE_EU,
+                "Exports of services": _UK_ONS_E_M_NATIONAL_EXPORTS_OF_SERVICES,
+            },
+            index=_three_cities_axes.sector_names,
+        )
     )
 
 
-@pytest.fixture
-def correct_uk_gva_2017(three_cities_io) -> Series:
+_UK_GVA_2017_VALUES: Final[ndarray] = _read_only_array(
+    [
+        114478795080.39958,
+        2523446181797.0215,
+        1239259094875.971,
+        3489714816208.268,
+        1150298982361.4224,
+        1536869889008.9902,
+        2733935955247.9546,
+        2623311335721.1494,
+        3373526621690.34,
+        641348328008.4843,
+    ],
+    dtype="float64",
+)
+
+
+@pytest.fixture(scope="session")
+def correct_uk_gva_2017(_three_cities_axes) -> Series:
     """Example G_m_national talies for testing.
 
     Todo:
@@ -549,354 +1269,437 @@ def correct_uk_gva_2017(three_cities_io) -> Series:
         * Checking column aggregation decimal points
     """
     return Series(
-        [
-            114478795080.39958,
-            2523446181797.0215,
-            1239259094875.971,
-            3489714816208.268,
-            1150298982361.4224,
-            1536869889008.9902,
-            2733935955247.9546,
-            2623311335721.1494,
-            3373526621690.34,
-            641348328008.4843,
-        ],
-        index=three_cities_io.sectors,
+        _UK_GVA_2017_VALUES,
+        index=_three_cities_axes.sectors,
     )
 
 
-@pytest.fixture
-def correct_uk_national_employment_2017(three_cities_io) -> Series:
+_UK_NATIONAL_EMPLOYMENT_2017_VALUES: Final[ndarray] = _read_only_array(
+    [
+        422000,
+        3129000,
+        2330000,
+        9036000,
+        1459000,
+        1114000,
+        589000,
+        6039000,
+        8756000,
+        1989000,
+    ],
+    dtype="int64",
+)
+
+
+@pytest.fixture(scope="session")
+def correct_uk_national_employment_2017(_three_cities_axes) -> Series:
     """Example national employment talies for testing.
 
     Todo:
         * Check results currently commented out.
     """
     return Series(
-        [
-            422000,
-            3129000,
-            2330000,
-            9036000,
-            1459000,
-            1114000,
-            589000,
-            6039000,
-            8756000,
-            1989000,
-        ],
-        dtype="int64",
-        index=three_cities_io.sectors,
+        _UK_NATIONAL_EMPLOYMENT_2017_VALUES,
+        index=_three_cities_axes.sectors,
     )
 
 
-@pytest.fixture
-def correct_leeds_2017_final_demand(three_cities_io) -> DataFrame:
-    """Example Leeds talies for testing."""
-    return DataFrame(
-        {
-            "Household Purchase": [
-                1004886244.222324,
-                14097639139.215887,
-                187988091.20858228,
-                34602039627.610664,
-                3858342436.7377596,
-                9566110980.934837,
-                36370986773.44653,
-                4263550339.258276,
-                7201643980.775884,
-                7973288006.432973,
-            ],
-            "Government Purchase": [
-                0.0,
-                1989836210.7172577,
-                0.0,
-                342708283.387409,
-                401783265.8556882,
-                0.0,
-                0.0,
-                0.0,
-                45584971720.16569,
-                487154565.57175225,
-            ],
-            "Non-profit Purchase": [
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                137719317.30700302,
-                342096741.12583256,
-                5103075555.950344,
-                883067025.7163072,
-            ],
-        },
-        index=three_cities_io.sector_names,
+_LEEDS_2017_FINAL_DEMAND_HOUSEHOLD_PURCHASE: Final[ndarray] = _read_only_array(
+    [
+        1004886244.222324,
+        14097639139.215887,
+        187988091.20858228,
+        34602039627.610664,
+        3858342436.7377596,
+        9566110980.934837,
+        36370986773.44653,
+        4263550339.258276,
+        7201643980.775884,
+        7973288006.432973,
+    ],
+    dtype="float64",
+)
+_LEEDS_2017_FINAL_DEMAND_GOVERNMENT_PURCHASE: Final[ndarray] = _read_only_array(
+    [
+        0.0,
+        1989836210.7172577,
+        0.0,
+        342708283.387409,
+        401783265.8556882,
+        0.0,
+        0.0,
+        0.0,
+        45584971720.16569,
+        487154565.57175225,
+    ],
+    dtype="float64",
+)
+_LEEDS_2017_FINAL_DEMAND_NON_PROFIT_PURCHASE: Final[ndarray] = _read_only_array(
+    [
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        137719317.30700302,
+        342096741.12583256,
+        5103075555.950344,
+        883067025.7163072,
+    ],
+    dtype="float64",
+)
+
+
+_LEEDS_2017_EXPORTS_EXPORTS_TO_EU: Final[ndarray] = _read_only_array(
+    [
+        50253457.5859584,
+        10919631206.432209,
+        0.0,
+        3155420168.3111267,
+        204851052.90529874,
+        0.0,
+        0.0,
+        4706293.276151647,
+        0.0,
+        1469699.6913630648,
+    ],
+    dtype="float64",
+)
+_LEEDS_2017_EXPORTS_EXPORTS_OUTSIDE_EU: Final[ndarray] = _read_only_array(
+    [
+        20638160.297732454,
+        10124408479.816885,
+        0.0,
+        2862419448.623728,
+        182619155.69077018,
+        0.0,
+        0.0,
+        1267078.9589639048,
+        0.0,
+        441736613.48531115,
+    ],
+    dtype="float64",
+)
+_LEEDS_2017_EXPORTS_EXPORTS_OF_SERVICES: Final[ndarray] = _read_only_array(
+    [
+        5367772.633490953,
+        1204784601.454469,
+        245898250.60355943,
+        5196907501.823861,
+        4986429279.408631,
+        21051133396.70893,
+        252546742.87362745,
+        20151623763.361942,
+        1410018180.9753628,
+        216872560.70676225,
+    ],
+    dtype="float64",
+)
+
+
+_LEEDS_2017_IMPORTS_VALUES: Final[ndarray] = _read_only_array(
+    [
+        112248945.77169241,
+        16024973674.257639,
+        1209521863.3633444,
+        5184214151.395373,
+        2319792690.4272084,
+        3135164009.7221417,
+        604659177.8010114,
+        3642778023.002527,
+        2743629731.074762,
+        362210403.89915055,
+    ],
+    dtype="float64",
+)
+
+
+@pytest.fixture(scope="session")
+def _leeds_2017_reference() -> DataFrame:
+    """Return all Leeds 2017 reference columns in one `DataFrame`.
+
+    `correct_leeds_2017_final_demand`, `correct_leeds_2017_exports` and
+    `correct_leeds_2017_imports` select their columns from this. Only
+    module-level arrays and `estios.input_output_tables` names are used,
+    so these do not import `estios.uk` or need ONS data.
+    """
+    from estios.input_output_tables import IMPORTS_COLUMN_NAME
+
+    return _read_only_frame(
+        DataFrame(
+            {
+                "Household Purchase": _LEEDS_2017_FINAL_DEMAND_HOUSEHOLD_PURCHASE,
+                "Government Purchase": _LEEDS_2017_FINAL_DEMAND_GOVERNMENT_PURCHASE,
+                "Non-profit Purchase": _LEEDS_2017_FINAL_DEMAND_NON_PROFIT_PURCHASE,
+                "Exports to EU": _LEEDS_2017_EXPORTS_EXPORTS_TO_EU,
+                "Exports outside EU": _LEEDS_2017_EXPORTS_EXPORTS_OUTSIDE_EU,
+                "Exports of services": _LEEDS_2017_EXPORTS_EXPORTS_OF_SERVICES,
+                IMPORTS_COLUMN_NAME: _LEEDS_2017_IMPORTS_VALUES,
+            },
+            index=_SECTOR_10_INDEX,
+        )
     )
 
 
-@pytest.fixture
-def correct_leeds_2017_exports(three_cities_io) -> DataFrame:
+@pytest.fixture(scope="session")
+def correct_leeds_2017_final_demand(_leeds_2017_reference) -> DataFrame:
     """Example Leeds talies for testing."""
-    return DataFrame(
-        {
-            "Exports to EU": [
-                50253457.5859584,
-                10919631206.432209,
-                0.0,
-                3155420168.3111267,
-                204851052.90529874,
-                0.0,
-                0.0,
-                4706293.276151647,
-                0.0,
-                1469699.6913630648,
-            ],
-            "Exports outside EU": [
-                20638160.297732454,
-                10124408479.816885,
-                0.0,
-                2862419448.623728,
-                182619155.69077018,
-                0.0,
-                0.0,
-                1267078.9589639048,
-                0.0,
-                441736613.48531115,
-            ],
-            "Exports of services": [
-                5367772.633490953,
-                1204784601.454469,
-                245898250.60355943,
-                5196907501.823861,
-                4986429279.408631,
-                21051133396.70893,
-                252546742.87362745,
-                20151623763.361942,
-                1410018180.9753628,
-                216872560.70676225,
-            ],
-        },
-        index=three_cities_io.sector_names,
-    )
+    from estios.input_output_tables import FINAL_DEMAND_COLUMN_NAMES
 
+    return _read_only_frame(_leeds_2017_reference[FINAL_DEMAND_COLUMN_NAMES])
 
-@pytest.fixture
-def correct_leeds_2017_imports(three_cities_io) -> Series:
+
+@pytest.fixture(scope="session")
+def correct_leeds_2017_exports(_leeds_2017_reference) -> DataFrame:
     """Example Leeds talies for testing."""
-    return Series(
-        [
-            112248945.77169241,
-            16024973674.257639,
-            1209521863.3633444,
-            5184214151.395373,
-            2319792690.4272084,
-            3135164009.7221417,
-            604659177.8010114,
-            3642778023.002527,
-            2743629731.074762,
-            362210403.89915055,
-        ],
-        index=three_cities_io.sector_names,
-        name="Imports",
-    )
+    return _read_only_frame(_leeds_2017_reference[_UK_EXPORT_COLUMN_NAMES])
 
 
-@pytest.fixture
-def correct_liverpool_2017_letter_sector_employment() -> Series:
+@pytest.fixture(scope="session")
+def correct_leeds_2017_imports(_leeds_2017_reference) -> Series:
+    """Example Leeds talies for testing."""
+    from estios.input_output_tables import IMPORTS_COLUMN_NAME
+
+    return _leeds_2017_reference[IMPORTS_COLUMN_NAME]
+
+
+_LIVERPOOL_2017_LETTER_SECTOR_EMPLOYMENT_VALUES: Final[ndarray] = _read_only_array(
+    [
+        125.0,
+        20.0,
+        23000.0,
+        550.0,
+        1850.0,
+        10500.0,
+        44000.0,
+        17000.0,
+        23000.0,
+        7600.0,
+        11250.0,
+        5600.0,
+        20000.0,
+        26000.0,
+        18750.0,
+        30000.0,
+        57000.0,
+        12000.0,
+        5500.0,
+        0.0,
+        0.0,
+    ],
+)
+
+
+@pytest.fixture(scope="session")
+def correct_liverpool_2017_letter_sector_employment(
+    uk_sector_letter_codes: tuple[str, ...],
+) -> Series:
     """Example Liverpool talies for testing."""
     return Series(
-        {
-            "A": 125.0,
-            "B": 20.0,
-            "C": 23000.0,
-            "D": 550.0,
-            "E": 1850.0,
-            "F": 10500.0,
-            "G": 44000.0,
-            "H": 17000.0,
-            "I": 23000.0,
-            "J": 7600.0,
-            "K": 11250.0,
-            "L": 5600.0,
-            "M": 20000.0,
-            "N": 26000.0,
-            "O": 18750.0,
-            "P": 30000.0,
-            "Q": 57000.0,
-            "R": 12000.0,
-            "S": 5500.0,
-            "T": 0.0,
-            "U": 0.0,
-        },
+        _LIVERPOOL_2017_LETTER_SECTOR_EMPLOYMENT_VALUES,
+        index=uk_sector_letter_codes,
         name="Liverpool",
     )
 
 
-@pytest.fixture
-def correct_agg_uk_nation_final_demand(three_cities_io) -> DataFrame:
+_AGG_UK_NATION_FINAL_DEMAND_HOUSEHOLD_PURCHASE: Final[ndarray] = _read_only_array(
+    [
+        82160000000.0,
+        1152630000000.0,
+        15370000000.0,
+        2829080000000.0,
+        315460000000.0,
+        782130000000.0,
+        2973710000000.0,
+        348590000000.0,
+        588810000000.0,
+        651900000000.0,
+    ],
+    dtype="float64",
+)
+_AGG_UK_NATION_FINAL_DEMAND_GOVERNMENT_PURCHASE: Final[ndarray] = _read_only_array(
+    [
+        0.0,
+        162690000000.0,
+        0.0,
+        28020000000.0,
+        32850000000.0,
+        0.0,
+        0.0,
+        0.0,
+        3727050000000.0,
+        39830000000.0,
+    ],
+    dtype="float64",
+)
+_AGG_UK_NATION_FINAL_DEMAND_NON_PROFIT_PURCHASE: Final[ndarray] = _read_only_array(
+    [
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        11260000000.0,
+        27970000000.0,
+        417230000000.0,
+        72200000000.0,
+    ],
+    dtype="float64",
+)
+
+
+@pytest.fixture(scope="session")
+def correct_agg_uk_nation_final_demand(_three_cities_axes) -> DataFrame:
     """Correct Final Demand columns aggregated from ONS IO table."""
-    return DataFrame(
-        {
-            "Household Purchase": [
-                82160000000.0,
-                1152630000000.0,
-                15370000000.0,
-                2829080000000.0,
-                315460000000.0,
-                782130000000.0,
-                2973710000000.0,
-                348590000000.0,
-                588810000000.0,
-                651900000000.0,
-            ],
-            "Government Purchase": [
-                0.0,
-                162690000000.0,
-                0.0,
-                28020000000.0,
-                32850000000.0,
-                0.0,
-                0.0,
-                0.0,
-                3727050000000.0,
-                39830000000.0,
-            ],
-            "Non-profit Purchase": [
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                11260000000.0,
-                27970000000.0,
-                417230000000.0,
-                72200000000.0,
-            ],
-        },
-        index=three_cities_io.sectors,
+    return _read_only_frame(
+        DataFrame(
+            {
+                "Household Purchase": _AGG_UK_NATION_FINAL_DEMAND_HOUSEHOLD_PURCHASE,
+                "Government Purchase": _AGG_UK_NATION_FINAL_DEMAND_GOVERNMENT_PURCHASE,
+                "Non-profit Purchase": _AGG_UK_NATION_FINAL_DEMAND_NON_PROFIT_PURCHASE,
+            },
+            index=_three_cities_axes.sectors,
+        )
     )
 
 
-@pytest.fixture
-def correct_three_cities_net_constraints(three_cities_io) -> Series:
+_THREE_CITIES_NET_CONSTRAINTS_VALUES: Final[ndarray] = _read_only_array(
+    [
+        -575776500.1558461,
+        -81570228.6040039,
+        -10193219683.637207,
+        7705115207.893555,
+        -18357526148.28531,
+        -1970161805.208252,
+        1611277983.1295166,
+        -12741971716.03125,
+        4888086242.563377,
+        -1613001982.3864212,
+        581180638.516919,
+        -1051041169.2158203,
+        8506352742.499756,
+        -1192563557.612915,
+        18074416781.87053,
+        -569175352.1763611,
+        1538901797.2315178,
+        6790536394.212891,
+        -6670343869.816658,
+        -7273559935.526257,
+        -5404138.36107254,
+        1132611397.8183594,
+        1686866941.1357422,
+        -6512551650.280273,
+        283109366.4147949,
+        2539337157.3846436,
+        -3150179780.3610535,
+        5951435321.818359,
+        1782257627.2532806,
+        8886561917.912674,
+    ],
+    dtype="float64",
+)
+
+
+@pytest.fixture(scope="session")
+def correct_three_cities_net_constraints(_three_cities_axes) -> Series:
     """Correct net_constrinats."""
     return Series(
-        [
-            -575776500.1558461,
-            -81570228.6040039,
-            -10193219683.637207,
-            7705115207.893555,
-            -18357526148.28531,
-            -1970161805.208252,
-            1611277983.1295166,
-            -12741971716.03125,
-            4888086242.563377,
-            -1613001982.3864212,
-            581180638.516919,
-            -1051041169.2158203,
-            8506352742.499756,
-            -1192563557.612915,
-            18074416781.87053,
-            -569175352.1763611,
-            1538901797.2315178,
-            6790536394.212891,
-            -6670343869.816658,
-            -7273559935.526257,
-            -5404138.36107254,
-            1132611397.8183594,
-            1686866941.1357422,
-            -6512551650.280273,
-            283109366.4147949,
-            2539337157.3846436,
-            -3150179780.3610535,
-            5951435321.818359,
-            1782257627.2532806,
-            8886561917.912674,
-        ],
-        index=three_cities_io._i_m_index,
+        _THREE_CITIES_NET_CONSTRAINTS_VALUES,
+        index=_three_cities_axes.i_m_index,
     )
 
 
-@pytest.fixture
-def correct_three_cities_exogenous_i_m(three_cities_io) -> Series:
+_THREE_CITIES_EXOGENOUS_I_M_VALUES: Final[ndarray] = _read_only_array(
+    [
+        475275297.49803674,
+        2629027936965.446,
+        2720291888458.155,
+        1414943499027.0188,
+        145782219852.89478,
+        443683899612.4415,
+        -17539174548.47934,
+        1723367377100.4407,
+        42471898723.38682,
+        24461507289.852673,
+        686285818.2823073,
+        1989476544024.3135,
+        1373748906813.3958,
+        1073425838631.5372,
+        80447520262.31895,
+        185120016905.1777,
+        -13781460228.055567,
+        746244518297.525,
+        30130472517.656296,
+        18076657412.483974,
+        2012615313.1343825,
+        8550926253780.018,
+        6892911187489.468,
+        4323943747647.6636,
+        390115006119.21747,
+        727139829610.5262,
+        -83171713573.1552,
+        3872009753751.092,
+        109226721548.12585,
+        81677900302.91348,
+    ],
+    dtype="float64",
+)
+
+
+@pytest.fixture(scope="session")
+def correct_three_cities_exogenous_i_m(_three_cities_axes) -> Series:
     """Correct net_constrinats."""
     return Series(
-        [
-            475275297.49803674,
-            2629027936965.446,
-            2720291888458.155,
-            1414943499027.0188,
-            145782219852.89478,
-            443683899612.4415,
-            -17539174548.47934,
-            1723367377100.4407,
-            42471898723.38682,
-            24461507289.852673,
-            686285818.2823073,
-            1989476544024.3135,
-            1373748906813.3958,
-            1073425838631.5372,
-            80447520262.31895,
-            185120016905.1777,
-            -13781460228.055567,
-            746244518297.525,
-            30130472517.656296,
-            18076657412.483974,
-            2012615313.1343825,
-            8550926253780.018,
-            6892911187489.468,
-            4323943747647.6636,
-            390115006119.21747,
-            727139829610.5262,
-            -83171713573.1552,
-            3872009753751.092,
-            109226721548.12585,
-            81677900302.91348,
-        ],
-        index=three_cities_io._i_m_index,
+        _THREE_CITIES_EXOGENOUS_I_M_VALUES,
+        index=_three_cities_axes.i_m_index,
     )
 
 
-@pytest.fixture
-def correct_three_cities_convergence_by_region(three_cities_io) -> Series:
+_THREE_CITIES_CONVERGENCE_BY_REGION_VALUES: Final[ndarray] = _read_only_array(
+    [
+        1051051797.6538829,
+        2629109507194.05,
+        2730485108141.792,
+        1407238383819.1252,
+        164139746001.18008,
+        445654061417.6498,
+        -19150452531.608856,
+        1736109348816.472,
+        37583812480.82344,
+        26074509272.239094,
+        105105179.76538828,
+        1990527585193.5293,
+        1365242554070.896,
+        1074618402189.1501,
+        62373103480.448425,
+        185689192257.35406,
+        -15320362025.287085,
+        739453981903.3121,
+        36800816387.47295,
+        25350217348.01023,
+        2018019451.495455,
+        8549793642382.199,
+        6891224320548.332,
+        4330456299297.944,
+        389831896752.8027,
+        724600492453.1416,
+        -80021533792.79414,
+        3866058318429.2734,
+        107444463920.87257,
+        72791338385.00081,
+    ],
+    dtype="float64",
+)
+
+
+@pytest.fixture(scope="session")
+def correct_three_cities_convergence_by_region(_three_cities_axes) -> Series:
     """Correct net_constrinats."""
     return Series(
-        [
-            1051051797.6538829,
-            2629109507194.05,
-            2730485108141.792,
-            1407238383819.1252,
-            164139746001.18008,
-            445654061417.6498,
-            -19150452531.608856,
-            1736109348816.472,
-            37583812480.82344,
-            26074509272.239094,
-            105105179.76538828,
-            1990527585193.5293,
-            1365242554070.896,
-            1074618402189.1501,
-            62373103480.448425,
-            185689192257.35406,
-            -15320362025.287085,
-            739453981903.3121,
-            36800816387.47295,
-            25350217348.01023,
-            2018019451.495455,
-            8549793642382.199,
-            6891224320548.332,
-            4330456299297.944,
-            389831896752.8027,
-            724600492453.1416,
-            -80021533792.79414,
-            3866058318429.2734,
-            107444463920.87257,
-            72791338385.00081,
-        ],
-        index=three_cities_io._i_m_index,
+        _THREE_CITIES_CONVERGENCE_BY_REGION_VALUES,
+        index=_three_cities_axes.i_m_index,
     )
 
 
@@ -916,71 +1719,77 @@ def correct_three_city_y_ij_m_model(three_cities_results) -> DataFrame:
     return three_cities_results.y_ij_m_model
 
 
-@pytest.fixture
+_THREE_CITY_Y_IJ_M_VALUES: Final[ndarray] = _read_only_array(
+    [
+        187110052.03173688,
+        -171707454.7924319,
+        2380595430.4575033,
+        -13957566.226788364,
+        4657647135.474765,
+        13894551.508998472,
+        195525822.0428764,
+        2536461009.587525,
+        -782621964.1941453,
+        -1258416526.3393195,
+        -32577569.16872643,
+        402290052.1768232,
+        1979351991.4088275,
+        -475505472.1741341,
+        -510963002.63355726,
+        1651376893.3006194,
+        -933322642.8213824,
+        5575187561.585223,
+        2124218926.1281013,
+        2650861567.6576333,
+        -24117971.448799916,
+        23951166.84773069,
+        -984029201.7312167,
+        1441064321.6112256,
+        -1977920848.518567,
+        -72804209.53653301,
+        155348205.39896077,
+        -805622544.7808626,
+        1570972046.4403393,
+        -69664847.16669689,
+        -3263584.3019685945,
+        305123022.85524696,
+        991446300.6394811,
+        -363762796.592353,
+        -194513259.6434869,
+        689304512.6766819,
+        -747993715.5551211,
+        2378864573.1835184,
+        2083684947.6571276,
+        2581836595.341186,
+        -467326523.10371447,
+        103822751.19287463,
+        -5012714636.48337,
+        5860587811.602413,
+        -12475769731.024534,
+        -286712688.69495565,
+        818884232.0966249,
+        -4250766848.3055334,
+        4628853887.863873,
+        -201878528.6345359,
+        363205931.9276654,
+        -564534766.0355452,
+        6074307243.627688,
+        -43424044.36434833,
+        11183681280.011944,
+        22840198.491409708,
+        826012340.146109,
+        5710499536.015272,
+        -2261985556.864712,
+        -3551751386.726035,
+    ],
+    dtype="float64",
+)
+
+
+@pytest.fixture(scope="session")
 def correct_three_city_y_ij_m(three_cities_results) -> Series:
     """Return correct `three_cities_results` of $y_{ij}^{(m)}$."""
     return Series(
-        [
-            187110052.03173688,
-            -171707454.7924319,
-            2380595430.4575033,
-            -13957566.226788364,
-            4657647135.474765,
-            13894551.508998472,
-            195525822.0428764,
-            2536461009.587525,
-            -782621964.1941453,
-            -1258416526.3393195,
-            -32577569.16872643,
-            402290052.1768232,
-            1979351991.4088275,
-            -475505472.1741341,
-            -510963002.63355726,
-            1651376893.3006194,
-            -933322642.8213824,
-            5575187561.585223,
-            2124218926.1281013,
-            2650861567.6576333,
-            -24117971.448799916,
-            23951166.84773069,
-            -984029201.7312167,
-            1441064321.6112256,
-            -1977920848.518567,
-            -72804209.53653301,
-            155348205.39896077,
-            -805622544.7808626,
-            1570972046.4403393,
-            -69664847.16669689,
-            -3263584.3019685945,
-            305123022.85524696,
-            991446300.6394811,
-            -363762796.592353,
-            -194513259.6434869,
-            689304512.6766819,
-            -747993715.5551211,
-            2378864573.1835184,
-            2083684947.6571276,
-            2581836595.341186,
-            -467326523.10371447,
-            103822751.19287463,
-            -5012714636.48337,
-            5860587811.602413,
-            -12475769731.024534,
-            -286712688.69495565,
-            818884232.0966249,
-            -4250766848.3055334,
-            4628853887.863873,
-            -201878528.6345359,
-            363205931.9276654,
-            -564534766.0355452,
-            6074307243.627688,
-            -43424044.36434833,
-            11183681280.011944,
-            22840198.491409708,
-            826012340.146109,
-            5710499536.015272,
-            -2261985556.864712,
-            -3551751386.726035,
-        ],
+        _THREE_CITY_Y_IJ_M_VALUES,
         index=three_cities_results._ij_m_index,
     )
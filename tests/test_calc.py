@@ -5,9 +5,9 @@ from logging import DEBUG
 from typing import Literal
 
 import pytest
-from numpy import absolute, exp, log, maximum
+from numpy import absolute, bincount, exp, log, maximum, ones
 from numpy.testing import assert_almost_equal
-from pandas import DataFrame, Series
+from pandas import DataFrame, Series, factorize
 from pandas.testing import assert_frame_equal, assert_series_equal
 
 from estios.calc import (
@@ -414,95 +414,92 @@ def balance_doubly_constrained(
     Bj_name: str = "Bj_new",
     converge: float = 0.001,
 ) -> DataFrame:
-    # Define some variables
-    Oi = pd[[orig_field, Oi_field]]
-    Dj = pd[[dest_field, Dj_field]]
     if cost_function.lower() in ["power", "pow"]:
-        beta_cij = exp(beta * log(pd[cij_field]))
+        beta_cij = exp(beta * log(pd[cij_field].to_numpy()))
     elif cost_function.lower() in ["exponential", "exp"]:
-        beta_cij = exp(beta * pd[cij_field])
+        beta_cij = exp(beta * pd[cij_field].to_numpy())
     else:
         raise ValueError(
             f"Cost function {cost_function} not specified properly, "
             f"only {COST_FUNCTION_NAMES} supported."
         )
 
-    # Create some helper variables
-    cnvg = 1
-    iteration = 0
+    # Integer codes per row for each origin and destination, so sums by
+    # origin or destination are a `bincount` rather than a `groupby`
+    oi_codes, origins = factorize(pd[orig_field])
+    dj_codes, destinations = factorize(pd[dest_field])
+    Oi_vals = pd[Oi_field].to_numpy()
+    Dj_vals = pd[Dj_field].to_numpy()
+
+    # Starting values assume Bj is a vector of 1s
+    Bj_old = ones(len(destinations))
+    Ai_old = 1.0 / bincount(
+        oi_codes, weights=Bj_old[dj_codes] * Dj_vals * beta_cij, minlength=len(origins)
+    )
+    Bj_old = 1.0 / bincount(
+        dj_codes,
+        weights=Ai_old[oi_codes] * Oi_vals * beta_cij,
+        minlength=len(destinations),
+    )
+
     # Now iteratively rebalance the Ai and Bj terms until convergence
+    cnvg = 1
     while cnvg > converge:
-        if iteration == 0:
-            # This first condition sets starting values for Ai and Bj
-            # NB sets starting value of Ai assuming Bj is a vector of 1s.
-            # We've already established beta_cij with the appropriate cost function, so...
-            Oi = Oi.assign(Ai=Dj[Dj_field] * beta_cij)
-            # Aggregate Ai and take inverse
-            Ai = 1.0 / Oi.groupby(orig_field)["Ai"].sum().to_frame()
-            # Merge new Ais
-            Oi = Oi.merge(
-                Ai, left_on=orig_field, right_index=True, suffixes=("", "_old")
-            )
-            # Drop the temporary Ai field we created, leaving Ai_old
-            Oi.drop("Ai", axis=1, inplace=True)
-
-            # Now set up Bjs using starting values of Ai
-            Dj = Dj.assign(Bj=Oi["Ai_old"] * Oi[Oi_field] * beta_cij)
-            # Aggregate Bj and take inverse
-            Bj = 1.0 / Dj.groupby(dest_field)["Bj"].sum().to_frame()
-            # Merge new Bjs
-            Dj = Dj.merge(
-                Bj, left_on=dest_field, right_index=True, suffixes=("", "_old")
-            )
-            # Drop the temporary Bj field we created, leaving Bj_old
-            Dj.drop("Bj", axis=1, inplace=True)
-
-            # Increment loop
-            iteration += 1
-        else:
-            # This bit is the iterated bit of the loop which refines the values of Ai and Bj
-            # First Ai
-            Oi["Ai"] = Dj["Bj_old"] * Dj[Dj_field] * beta_cij
-            # Aggregate Ai and take inverse
-            Ai = 1.0 / Oi.groupby(orig_field)["Ai"].sum().to_frame()
-            # Drop temporary Ai
-            Oi.drop("Ai", axis=1, inplace=True)
-            # Merge new Ais
-            Oi = Oi.merge(Ai, left_on=orig_field, right_index=True)
-            # Calculate the difference between old and new Ais
-            Oi["diff"] = absolute((Oi["Ai_old"] - Oi["Ai"]) / Oi["Ai_old"])
-            # Set new Ais to Ai_old
-            Oi["Ai_old"] = Oi["Ai"]
-            # Drop the temporary Ai field we created, leaving Ai_old
-            Oi.drop("Ai", axis=1, inplace=True)
-
-            # Then Bj
-            Dj["Bj"] = Oi["Ai_old"] * Oi[Oi_field] * beta_cij
-            # Aggregate Bj and take inverse
-            Bj = 1.0 / Dj.groupby(dest_field)["Bj"].sum().to_frame()
-            # Drop temporary Bj
-            Dj.drop("Bj", axis=1, inplace=True)
-            # Merge new Bjs
-            Dj = Dj.merge(Bj, left_on=dest_field, right_index=True)
-            # Calculate the difference between old and new Bjs
-            Dj["diff"] = absolute((Dj["Bj_old"] - Dj["Bj"]) / Dj["Bj_old"])
-            # Set new Bjs to Bj_old
-            Dj["Bj_old"] = Dj["Bj"]
-            # Drop the temporary Bj field we created, leaving Bj_old
-            Dj.drop("Bj", axis=1, inplace=True)
-
-            # Assign higher sum difference from Ai or Bj to cnvg
-            cnvg = maximum(Oi["diff"].sum(), Dj["diff"].sum())
-
-            # Print and increment loop
-            print("Iteration:", iteration)
-            iteration += 1
-
-    # When the while loop finishes add the computed Ai_old and Bj_old to the dataframe and return
-    pd[Ai_name] = Oi["Ai_old"]
-    pd[Bj_name] = Dj["Bj_old"]
+        Ai = 1.0 / bincount(
+            oi_codes,
+            weights=Bj_old[dj_codes] * Dj_vals * beta_cij,
+            minlength=len(origins),
+        )
+        # Differences are summed per row of `pd`, as in the original notebook
+        Ai_diff = absolute((Ai_old[oi_codes] - Ai[oi_codes]) / Ai_old[oi_codes]).sum()
+        Ai_old = Ai
+
+        Bj = 1.0 / bincount(
+            dj_codes,
+            weights=Ai_old[oi_codes] * Oi_vals * beta_cij,
+            minlength=len(destinations),
+        )
+        Bj_diff = absolute((Bj_old[dj_codes] - Bj[dj_codes]) / Bj_old[dj_codes]).sum()
+        Bj_old = Bj
+
+        # Assign higher sum difference from Ai or Bj to cnvg
+        cnvg = maximum(Ai_diff, Bj_diff)
+
+    # Add the computed Ai and Bj for each row to the dataframe and return
+    pd[Ai_name] = Ai_old[oi_codes]
+    pd[Bj_name] = Bj_old[dj_codes]
     return pd
 
+
+def test_balance_doubly_constrained() -> None:
+    """Test balanced flows sum to their origin and destination totals."""
+    flows = DataFrame(
+        {
+            "origin": ["A", "A", "A", "B", "B", "B", "C", "C", "C"],
+            "destination": ["X", "Y", "Z", "X", "Y", "Z", "X", "Y", "Z"],
+            "Oi": [100.0, 100.0, 100.0, 200.0, 200.0, 200.0, 300.0, 300.0, 300.0],
+            "Dj": [150.0, 250.0, 200.0, 150.0, 250.0, 200.0, 150.0, 250.0, 200.0],
+            "cij": [1.0, 5.0, 10.0, 5.0, 1.0, 5.0, 10.0, 5.0, 1.0],
+        }
+    )
+    beta: float = -0.1
+    balanced = balance_doubly_constrained(
+        flows, "origin", "destination", "Oi", "Dj", "cij", beta, "exp", converge=1e-9
+    )
+    T_ij: Series = (
+        balanced["Ai_new"]
+        * balanced["Oi"]
+        * balanced["Bj_new"]
+        * balanced["Dj"]
+        * exp(beta * balanced["cij"])
+    )
+    assert_almost_equal(
+        T_ij.groupby(balanced["origin"]).sum().to_numpy(), [100.0, 200.0, 300.0]
+    )
+    assert_almost_equal(
+        T_ij.groupby(balanced["destination"]).sum().to_numpy(), [150.0, 250.0, 200.0]
+    )
+
     # config_dict = {
     #     date: {"employment_date": date,
     #            "_national_employmentn":
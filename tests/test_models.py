@@ -5,8 +5,8 @@ Todo:
     * test raising NullRawRegionError and RawRegionTypeError,
 """
 import pytest
-from pandas import DataFrame, Series, read_csv
-from pandas.testing import assert_frame_equal, assert_series_equal
+from pandas import DataFrame, Index, Series, read_csv
+from pandas.testing import assert_frame_equal, assert_index_equal, assert_series_equal
 
 from estios import __version__
 from estios.uk.models import InterRegionInputOutputUK2017
@@ -121,6 +121,23 @@ class TestInputOutputModel:
         )
         assert_series_equal(three_cities_io.distances["Distance"], CORRECT_DISTANCES)
 
+    def test_3_city_indexes_cached(self, three_cities_io) -> None:
+        assert three_cities_io._i_m_index is three_cities_io._i_m_index
+        assert three_cities_io._ij_m_index is three_cities_io._ij_m_index
+        assert three_cities_io._ij_index is three_cities_io._ij_index
+
+    def test_3_city_axes_match_model(self, three_cities_io, _three_cities_axes) -> None:
+        """Test reference fixture indexes match `three_cities_io` defaults."""
+        assert_index_equal(_three_cities_axes.sectors, Index(three_cities_io.sectors))
+        assert_index_equal(_three_cities_axes.i_m_index, three_cities_io._i_m_index)
+
+    def test_3_city_matrices_cached(self, three_cities_io) -> None:
+        assert three_cities_io.distances is three_cities_io.distances
+        assert (
+            three_cities_io.technical_coefficients
+            is three_cities_io.technical_coefficients
+        )
+
     def test_national_final_demand(
         self, three_cities_io, correct_agg_uk_nation_final_demand
     ) -> None:
@@ -460,6 +477,7 @@ class TestInputOutputModel:
         "`y_ij_m` currently returns a full table "
         "while correct result is a Series"
     )
+    @pytest.mark.mutates_io
     def test_import_export_convergence(
         self,
         three_cities_io,
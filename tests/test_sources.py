@@ -329,3 +329,46 @@ class TestMetaSourceManager:
         # assert meta_source_handler.meta_data_field.size == 4949
         # assert len(caplog.messages) == 7
         # assert caplog.messages[0] == self.META_DATA_FIELD_LOG
+
+
+class TestMetaDataClone:
+
+    """Test shallow cloning of `MetaData` instances."""
+
+    def test_clone_kwargs_are_independent(self) -> None:
+        meta_data = MetaData(
+            name="Test", year=2017, region="UK", _reader_kwargs={"index_col": 0}
+        )
+        cloned: MetaData = meta_data.clone(
+            path="test.csv", reader_kwargs={"region_names": ("Leeds",)}
+        )
+        assert cloned.path == "test.csv"
+        assert cloned._reader_kwargs == {"index_col": 0, "region_names": ("Leeds",)}
+        assert meta_data._reader_kwargs == {"index_col": 0}
+        assert meta_data.path is None
+        cloned._save_kwargs["zip_file_path"] = "test.zip"
+        assert not meta_data._save_kwargs
+
+    def test_clone_to_folder(self, tmp_path) -> None:
+        meta_data = MetaData(name="Test", year=2017, region="UK", path="data/test.csv")
+        cloned: MetaData = meta_data.clone(folder=tmp_path)
+        assert cloned.path == tmp_path / "test.csv"
+        assert meta_data.path == "data/test.csv"
+
+    def test_save_local_skips_existing(self, tmp_path) -> None:
+        def fail_save(*args, **kwargs) -> None:
+            raise AssertionError("`save_local` should not download again")
+
+        local_file: Path = tmp_path / "test.csv"
+        local_file.write_text("a,b\n1,2\n")
+        meta_data = MetaData(
+            name="Test", year=2017, region="UK", path=local_file, _save_func=fail_save
+        )
+        assert meta_data.save_local() is None
+        with pytest.raises(AssertionError):
+            meta_data.save_local(force_overwrite=True)
+
+    def test_clone_invalid_attribute(self) -> None:
+        meta_data = MetaData(name="Test", year=2017, region="UK")
+        with pytest.raises(AttributeError):
+            meta_data.clone(not_a_field=True)
@@ -197,7 +197,7 @@ class TestInputOutputTimeSeries:
             date: {"employment_date": date} for date in quarterly_2017_employment_dates
         }
         time_series = date_io_time_series_ons_2017(
-            date_conf=config_dict, regions=three_cities
+            date_conf=config_dict, regions=dict(three_cities)
         )
         assert time_series[0].date == date(2017, 3, 1)
         assert time_series.dates.index(time_series[0].date) == 0
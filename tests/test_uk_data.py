@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 from logging import DEBUG, INFO
+from types import MappingProxyType
 from typing import Final, Sequence
 
 import pytest
@@ -118,7 +119,7 @@ class TestLoadingCentreForCitiesData:
             assert correct_index in cities_geo.index
 
 
-def test_get_all_centre_for_cities(all_cities: dict) -> None:
+def test_get_all_centre_for_cities(all_cities: MappingProxyType) -> None:
     """Test generating city: region dictionary from Centre for Cities.
 
     Note:
@@ -572,7 +573,7 @@ class TestNomisRegionalEmployment:
         region_employment: DataFrame = get_employment_by_region_by_sector(
             year=2017,
             ignore_key_errors=True,
-            region_names=all_cities,
+            region_names=dict(all_cities),
         )
         assert (
             region_employment.loc["Liverpool"]
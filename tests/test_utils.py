@@ -4,6 +4,7 @@
 from dataclasses import dataclass, field
 from itertools import product
 from logging import DEBUG
+from math import isnan
 
 import pytest
 from pandas import DataFrame, MultiIndex, Series
@@ -25,6 +26,8 @@ from estios.utils import (  # download_and_extract_zip_file,
     get_attr_from_str,
     human_readable_num_abbrv,
     invert_dict,
+    log_x_or_return_zero,
+    log_x_or_return_zero_array,
     match_df_cols_rows,
     match_ordered_iters,
     name_converter,
@@ -119,6 +122,14 @@ def test_invert_dict() -> None:
     assert invert_dict(test_dict) == correct_inversion
 
 
+def test_log_x_or_return_zero_array() -> None:
+    test_values: list[float] = [0.0, 0.5, 1.0, 10.0, -2.0]
+    logged = log_x_or_return_zero_array(test_values)
+    assert list(logged[:-1]) == [log_x_or_return_zero(x) for x in test_values[:-1]]
+    assert isnan(logged[-1])
+    assert log_x_or_return_zero(test_values[-1]) is None
+
+
 class TestMatchItersColsRows:
     test_x: tuple = ("cat", "frog", 4, 7, (3, 4))
     test_y: list = ["cat", "cat", 4.0, 7, (3, 4)]
@@ -6,10 +6,12 @@ from matplotlib.axes import Axes
 from plotly.graph_objects import Figure
 
 from estios.models import InterRegionInputOutput
+from estios.utils import filter_y_ij_m_by_city_sector
 from estios.visualisation import (
     add_mapbox_edges,
     convert_geom_for_mapbox,
     draw_ego_flows_network,
+    filter_flows_cached,
     generate_colour_scheme,
     plot_iterations,
     sector_flows_bar_chart,
@@ -31,6 +33,24 @@ def test_add_mapbox_edges(three_cities_results: InterRegionInputOutput) -> None:
     assert fig.layout["legend"]["title"]["text"] == "Flows from Manchester"
 
 
+def test_filter_flows_cached(three_cities_results: InterRegionInputOutput) -> None:
+    """Test cached flows match and are copies of uncached flows."""
+    flows = filter_flows_cached(
+        three_cities_results.y_ij_m_model, "Manchester", "Agriculture"
+    )
+    assert flows.equals(
+        filter_y_ij_m_by_city_sector(
+            three_cities_results.y_ij_m_model, "Manchester", "Agriculture"
+        )
+    )
+    flows.iloc[0] = -1.0
+    assert not flows.equals(
+        filter_flows_cached(
+            three_cities_results.y_ij_m_model, "Manchester", "Agriculture"
+        )
+    )
+
+
 class TestGenerateColourScheme:
 
     """Test generating colour schemes for region visualisation harmony."""